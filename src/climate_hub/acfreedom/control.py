@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
-from typing import cast
+import sys
 
 from climate_hub.acfreedom.exceptions import InvalidParameterError
 from climate_hub.api import constants as C
 from climate_hub.api.models import ACFanSpeed, ACMode
 
+# Valid swing directions (literal keys are interned by the compiler)
+_SWING_DIRECTIONS = frozenset({"vertical", "horizontal"})
+
+# Swing presets keyed by (is_vertical, state)
+_SWING_TABLE: dict[tuple[bool, bool], dict[str, int]] = {
+    (True, True): C.AC_SWING_VERTICAL_ON,
+    (True, False): C.AC_SWING_VERTICAL_OFF,
+    (False, True): C.AC_SWING_HORIZONTAL_ON,
+    (False, False): C.AC_SWING_HORIZONTAL_OFF,
+}
+
 
 class DeviceControl:
     """Device control logic with validation."""
@@ -15,6 +26,7 @@ class DeviceControl:
     # Temperature constants
     MIN_TEMPERATURE = 16
     MAX_TEMPERATURE = 30
+    _TEMP_RANGE = (f"{MIN_TEMPERATURE}-{MAX_TEMPERATURE}°C",)
 
     # Mode mappings (string to API dict)
     MODE_MAP = {
@@ -24,9 +36,10 @@ class DeviceControl:
         "fan": C.AC_MODE_FAN,
         "auto": C.AC_MODE_AUTO,
     }
+    _MODE_KEYS = tuple(MODE_MAP)
 
     # Mode names (int to string)
-    MODE_NAMES = {
+    MODE_NAMES: dict[int, str] = {
         ACMode.COOLING: "Cooling",
         ACMode.HEATING: "Heating",
         ACMode.DRY: "Dry",
@@ -43,9 +56,14 @@ class DeviceControl:
         "turbo": ACFanSpeed.TURBO,
         "mute": ACFanSpeed.MUTE,
     }
+    _FAN_SPEED_KEYS = tuple(FAN_SPEED_MAP)
+    # Prebuilt API dicts per fan speed string
+    _FAN_SPEED_PARAMS: dict[str, dict[str, int]] = {
+        name: {C.AC_FAN_SPEED: speed} for name, speed in FAN_SPEED_MAP.items()
+    }
 
     # Fan speed names (int to string)
-    FAN_SPEED_NAMES = {
+    FAN_SPEED_NAMES: dict[int, str] = {
         ACFanSpeed.AUTO: "Auto",
         ACFanSpeed.LOW: "Low",
         ACFanSpeed.MEDIUM: "Medium",
@@ -64,12 +82,10 @@ class DeviceControl:
         Raises:
             InvalidParameterError: If temperature is out of range
         """
-        if not (DeviceControl.MIN_TEMPERATURE <= temperature <= DeviceControl.MAX_TEMPERATURE):
-            raise InvalidParameterError(
-                "temperature",
-                temperature,
-                [f"{DeviceControl.MIN_TEMPERATURE}-{DeviceControl.MAX_TEMPERATURE}°C"],
-            )
+        min_temp = DeviceControl.MIN_TEMPERATURE
+        max_temp = DeviceControl.MAX_TEMPERATURE
+        if not (min_temp <= temperature <= max_temp):
+            raise InvalidParameterError("temperature", temperature, DeviceControl._TEMP_RANGE)
 
     @staticmethod
     def celsius_to_api(celsius: int) -> int:
@@ -108,10 +124,10 @@ class DeviceControl:
         Raises:
             InvalidParameterError: If mode is invalid
         """
-        mode_lower = mode.lower()
-        if mode_lower not in DeviceControl.MODE_MAP:
-            raise InvalidParameterError("mode", mode, list(DeviceControl.MODE_MAP.keys()))
-        return DeviceControl.MODE_MAP[mode_lower]
+        params = DeviceControl.MODE_MAP.get(sys.intern(mode.lower()))
+        if params is None:
+            raise InvalidParameterError("mode", mode, DeviceControl._MODE_KEYS)
+        return params
 
     @staticmethod
     def get_mode_name(mode: int) -> str:
@@ -123,7 +139,8 @@ class DeviceControl:
         Returns:
             Mode name string
         """
-        return DeviceControl.MODE_NAMES.get(cast(ACMode, mode), f"Unknown ({mode})")
+        name = DeviceControl.MODE_NAMES.get(mode)
+        return name if name is not None else f"Unknown ({mode})"
 
     @staticmethod
     def validate_fan_speed(speed: str) -> dict[str, int]:
@@ -138,12 +155,10 @@ class DeviceControl:
         Raises:
             InvalidParameterError: If speed is invalid
         """
-        speed_lower = speed.lower()
-        if speed_lower not in DeviceControl.FAN_SPEED_MAP:
-            raise InvalidParameterError(
-                "fan_speed", speed, list(DeviceControl.FAN_SPEED_MAP.keys())
-            )
-        return {C.AC_FAN_SPEED: DeviceControl.FAN_SPEED_MAP[speed_lower]}
+        params = DeviceControl._FAN_SPEED_PARAMS.get(sys.intern(speed.lower()))
+        if params is None:
+            raise InvalidParameterError("fan_speed", speed, DeviceControl._FAN_SPEED_KEYS)
+        return params
 
     @staticmethod
     def get_fan_speed_name(speed: int) -> str:
@@ -155,7 +170,8 @@ class DeviceControl:
         Returns:
             Fan speed name string
         """
-        return DeviceControl.FAN_SPEED_NAMES.get(cast(ACFanSpeed, speed), f"Unknown ({speed})")
+        name = DeviceControl.FAN_SPEED_NAMES.get(speed)
+        return name if name is not None else f"Unknown ({speed})"
 
     @staticmethod
     def validate_swing_direction(direction: str) -> None:
@@ -167,8 +183,8 @@ class DeviceControl:
         Raises:
             InvalidParameterError: If direction is invalid
         """
-        if direction.lower() not in ["vertical", "horizontal"]:
-            raise InvalidParameterError("swing_direction", direction, ["vertical", "horizontal"])
+        if sys.intern(direction.lower()) not in _SWING_DIRECTIONS:
+            raise InvalidParameterError("swing_direction", direction, ("vertical", "horizontal"))
 
     @staticmethod
     def get_swing_params(direction: str, state: bool) -> dict[str, int]:
@@ -181,6 +197,4 @@ class DeviceControl:
         Returns:
             API swing parameters
         """
-        if direction.lower() == "vertical":
-            return C.AC_SWING_VERTICAL_ON if state else C.AC_SWING_VERTICAL_OFF
-        return C.AC_SWING_HORIZONTAL_ON if state else C.AC_SWING_HORIZONTAL_OFF
+        return _SWING_TABLE[(direction.lower() == "vertical", bool(state))]
@@ -6,13 +6,13 @@ import asyncio
 import logging
 import time
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any
 
 from climate_hub.acfreedom.control import DeviceControl
 from climate_hub.acfreedom.device import DeviceFinder
 from climate_hub.acfreedom.exceptions import (
     ClimateHubError,
-    DeviceNotFoundError,
     DeviceOfflineError,
     ServerBusyError,
 )
@@ -32,10 +32,47 @@ from climate_hub.api.exceptions import (
     ServerBusyError as APIServerBusyError,
 )
 from climate_hub.api.models import AuxProducts, Device
+from climate_hub.api.types import FamilyInfo
 
 logger = logging.getLogger(__name__)
 
 
+def _generic_control_error(_device: Device, exc: AuxAPIError) -> ClimateHubError:
+    """Map any unlisted API error to a generic ClimateHubError."""
+    return ClimateHubError(str(exc))
+
+
+# API exception class -> business exception factory for control commands
+_CONTROL_ERROR_MAP: dict[type[AuxAPIError], Callable[[Device, AuxAPIError], ClimateHubError]] = {
+    APIServerBusyError: lambda _device, _exc: ServerBusyError(),
+    APIDeviceOfflineError: lambda device, _exc: DeviceOfflineError(
+        device.endpoint_id, device.friendly_name
+    ),
+}
+
+
+def _map_control_error(device: Device, exc: AuxAPIError) -> ClimateHubError:
+    """Map an API error to its business exception (subclasses match their base)."""
+    for cls in type(exc).__mro__:
+        factory = _CONTROL_ERROR_MAP.get(cls)
+        if factory is not None:
+            return factory(device, exc)
+    return _generic_control_error(device, exc)
+
+
+# Power presets indexed by bool(requested state) (False -> off, True -> on)
+_POWER_PARAMS = (AC_POWER_OFF, AC_POWER_ON)
+
+
+@dataclass(slots=True)
+class _MonitorState:
+    """Per-device monitor bookkeeping (Type 2 task)."""
+
+    task: asyncio.Task[None] | None = None
+    trigger: asyncio.Event = field(default_factory=asyncio.Event)
+    error_count: int = 0
+
+
 class DeviceCoordinator:
     """Orchestrates device discovery, monitoring, and state management.
 
@@ -51,12 +88,15 @@ class DeviceCoordinator:
         """
         self.api = api_client
         self._devices: dict[str, Device] = {}
-        self._monitors: dict[str, asyncio.Task[None]] = {}
-        self._triggers: dict[str, asyncio.Event] = {}
-        self._ready_events: dict[str, asyncio.Event] = {}
+        self._devices_by_name: dict[str, Device] = {}
+        self._monitors: dict[str, _MonitorState] = {}
+        # Startup latch: monitors that have not completed a first pass yet
+        self._pending_ready: dict[str, _MonitorState] = {}
+        self._all_ready = asyncio.Event()
         self._discovery_task: asyncio.Task[None] | None = None
-        self._on_update_callbacks: list[Callable[[Device], Any]] = []
-        self._error_counts: dict[str, int] = {}
+        # Immutable snapshot of (callback, is_coroutine_function) pairs
+        self._on_update_callbacks: tuple[tuple[Callable[[Device], Any], bool], ...] = ()
+        self._ts_cache: tuple[int, str] | None = None
 
         # Intervals
         self.discovery_interval = 60
@@ -70,13 +110,14 @@ class DeviceCoordinator:
         Args:
             callback: Function called with the updated Device object
         """
-        self._on_update_callbacks.append(callback)
+        is_async = asyncio.iscoroutinefunction(callback)
+        self._on_update_callbacks = (*self._on_update_callbacks, (callback, is_async))
 
     async def _notify_update(self, device: Device) -> None:
         """Notify all callbacks of a device update."""
-        for callback in self._on_update_callbacks:
+        for callback, is_async in self._on_update_callbacks:
             try:
-                if asyncio.iscoroutinefunction(callback):
+                if is_async:
                     await callback(device)
                 else:
                     callback(device)
@@ -100,10 +141,8 @@ class DeviceCoordinator:
 
             # Wait for all monitors to complete at least one cycle
             logger.info("Waiting for initial per-device parameter fetch...")
-            await asyncio.gather(
-                *[self._ready_events[did].wait() for did in self._ready_events],
-                return_exceptions=True,
-            )
+            if self._pending_ready:
+                await self._all_ready.wait()
 
         # 3. Start Discovery Loop in background
         self._discovery_task = asyncio.create_task(self._discovery_loop())
@@ -115,11 +154,12 @@ class DeviceCoordinator:
         if self._discovery_task:
             self._discovery_task.cancel()
 
-        for task in self._monitors.values():
+        tasks = [state.task for state in self._monitors.values() if state.task]
+        for task in tasks:
             task.cancel()
 
-        if self._monitors:
-            await asyncio.gather(*self._monitors.values(), return_exceptions=True)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         logger.info("DeviceCoordinator stopped")
 
@@ -129,77 +169,125 @@ class DeviceCoordinator:
 
     def find_device(self, device_id: str) -> Device:
         """Find device by ID or name in cache."""
-        device = DeviceFinder.find_device(self.get_devices(), device_id)
-        if not device:
-            raise DeviceNotFoundError(device_id)
-        return device
+        return DeviceFinder.find_indexed(self._devices, self._devices_by_name, device_id)
+
+    def _rebuild_name_index(self) -> None:
+        """Rebuild the lowercase name index (first device wins on duplicates)."""
+        self._devices_by_name = DeviceFinder.index_by_name(self._devices.values())
 
     def trigger_update(self, device_id: str) -> None:
         """Trigger an immediate update for a device."""
-        if device_id in self._triggers:
-            self._triggers[device_id].set()
+        state = self._monitors.get(device_id)
+        # A pending trigger already guarantees a refresh; coalesce repeats
+        if state is not None and not state.trigger.is_set():
+            state.trigger.set()
             logger.debug("Update triggered for device %s", device_id)
 
+    def _now_str(self) -> str:
+        """Get the current local time formatted for last_updated.
+
+        The formatted string is cached per wall-clock second so monitors
+        firing within the same second share one strftime() call.
+        """
+        now = int(time.time())
+        cached = self._ts_cache
+        if cached is None or cached[0] != now:
+            cached = (now, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)))
+            self._ts_cache = cached
+        return cached[1]
+
     async def _discovery_step(self) -> None:
         """Perform a single discovery step (Type 1 task)."""
         try:
             families_data = await self.api.get_families()
-            all_discovered_ids = set()
-
-            for family in families_data:
-                family_id = family["familyid"]
-
-                # Fetch both owned and shared devices
-                owned_devices = await self.api.get_devices(family_id, shared=False)
-                shared_devices = await self.api.get_devices(family_id, shared=True)
-
-                # Combine lists
-                devices_raw = owned_devices + shared_devices
-
-                # Query basic state (online/offline)
-                if devices_raw:
-                    state_data = await self.api.bulk_query_device_state(devices_raw)
-                    for dev_raw in devices_raw:
-                        # Device object uses 'endpointId', state uses 'did'
-                        did = dev_raw.get("endpointId")
-                        if not did:
-                            logger.warning("Device missing endpointId: %s", dev_raw)
-                            continue
-
-                        all_discovered_ids.add(did)
-
-                        state = next((s["state"] for s in state_data["data"] if s["did"] == did), 0)
-
-                        if did not in self._devices:
-                            # New device found
-                            logger.info("New device discovered: %s", did)
-                            device = Device(**dev_raw)
-                            device.state = state
-                            self._devices[did] = device
-                            if self._discovery_task:  # If loop is already running
-                                self._start_monitor(did)
-                        else:
-                            # Update basic state in existing device
-                            self._devices[did].state = state
+
+            # Families are independent, so list their devices concurrently
+            results = await asyncio.gather(
+                *(self._list_family_devices(family) for family in families_data),
+                return_exceptions=True,
+            )
+
+            devices_raw: list[dict[str, Any]] = []
+            for result in results:
+                if isinstance(result, BaseException):
+                    # A partial view must not be mistaken for removed devices
+                    raise result
+                devices_raw.extend(result)
+
+            # One state query for every family's devices
+            all_discovered_ids = await self._sync_devices(devices_raw)
 
             # Cleanup removed devices
-            removed_ids = set(self._devices.keys()) - all_discovered_ids
+            removed_ids = self._devices.keys() - all_discovered_ids
             for did in removed_ids:
                 logger.info("Device removed: %s", did)
-                if did in self._monitors:
-                    self._monitors[did].cancel()
-                    del self._monitors[did]
-                if did in self._triggers:
-                    del self._triggers[did]
-                if did in self._ready_events:
-                    del self._ready_events[did]
-                if did in self._error_counts:
-                    del self._error_counts[did]
+                state = self._monitors.pop(did, None)
+                if state is not None:
+                    if state.task is not None:
+                        state.task.cancel()
+                    self._mark_ready(did, state)
                 del self._devices[did]
 
+            self._rebuild_name_index()
+
         except Exception as e:
             logger.error("Error during discovery step: %s", e)
 
+    async def _list_family_devices(self, family: FamilyInfo) -> list[dict[str, Any]]:
+        """List the owned and shared devices of one family.
+
+        Args:
+            family: Family info from get_families()
+
+        Returns:
+            Raw device dictionaries
+        """
+        family_id = family["familyid"]
+        owned_devices = await self.api.get_devices(family_id, shared=False)
+        shared_devices = await self.api.get_devices(family_id, shared=True)
+        return owned_devices + shared_devices
+
+    async def _sync_devices(self, devices_raw: list[dict[str, Any]]) -> set[str]:
+        """Sync discovered devices and their basic state with a single bulk query.
+
+        Args:
+            devices_raw: Raw device dictionaries from all families
+
+        Returns:
+            Set of discovered endpoint IDs
+        """
+        discovered_ids: set[str] = set()
+        if not devices_raw:
+            return discovered_ids
+
+        # Query basic state (online/offline)
+        state_data = await self.api.bulk_query_device_state(devices_raw)
+        state_by_did = {s["did"]: s["state"] for s in state_data["data"]}
+        for dev_raw in devices_raw:
+            # Device object uses 'endpointId', state uses 'did'
+            did = dev_raw.get("endpointId")
+            if not did:
+                logger.warning("Device missing endpointId: %s", dev_raw)
+                continue
+
+            discovered_ids.add(did)
+
+            state = state_by_did.get(did, 0)
+
+            if did not in self._devices:
+                # New device found
+                logger.info("New device discovered: %s", did)
+                device = Device.from_trusted(dev_raw)
+                device.state = state
+                self._devices[did] = device
+                if self._discovery_task:  # If loop is already running
+                    self._start_monitor(did)
+            else:
+                # Update basic state in existing device
+                self._devices[did].state = state
+
+        return discovered_ids
+
     async def _discovery_loop(self) -> None:
         """Periodic discovery loop (Type 1 task)."""
         while True:
@@ -211,14 +299,27 @@ class DeviceCoordinator:
         if device_id in self._monitors:
             return
 
-        self._triggers[device_id] = asyncio.Event()
-        self._ready_events[device_id] = asyncio.Event()
-        self._error_counts[device_id] = 0
-        self._monitors[device_id] = asyncio.create_task(self._monitor_loop(device_id))
+        state = _MonitorState()
+        self._monitors[device_id] = state
+        self._pending_ready[device_id] = state
+        self._all_ready.clear()
+        state.task = asyncio.create_task(self._monitor_loop(device_id, state))
+
+    def _mark_ready(self, device_id: str, state: _MonitorState) -> None:
+        """Release a monitor from the startup latch (idempotent).
 
-    async def _monitor_loop(self, device_id: str) -> None:
+        Only the monitor currently pending for ``device_id`` counts down, so
+        repeated calls or a stale monitor of a re-added device are no-ops.
+        """
+        if self._pending_ready.get(device_id) is state:
+            del self._pending_ready[device_id]
+            if not self._pending_ready:
+                self._all_ready.set()
+
+    async def _monitor_loop(self, device_id: str, state: _MonitorState) -> None:
         """Active monitor loop for a single device (Type 2 task)."""
         logger.debug("Starting monitor for device %s", device_id)
+        trigger = state.trigger
 
         while True:
             try:
@@ -226,39 +327,35 @@ class DeviceCoordinator:
                 device = self._devices.get(device_id)
                 if device and device.is_online:
                     await self._fetch_params(device)
-                    device.last_updated = time.strftime("%Y-%m-%d %H:%M:%S")
+                    device.last_updated = self._now_str()
                     await self._notify_update(device)
 
                     # Reset error count on successful fetch
-                    self._error_counts[device_id] = 0
+                    state.error_count = 0
 
                 # Signal ready on first successful (or offline) pass
-                if not self._ready_events[device_id].is_set():
-                    self._ready_events[device_id].set()
+                self._mark_ready(device_id, state)
 
                 # 2. Wait for Trigger or Timeout
                 try:
-                    await asyncio.wait_for(
-                        self._triggers[device_id].wait(), timeout=self.monitor_interval
-                    )
+                    await asyncio.wait_for(trigger.wait(), timeout=self.monitor_interval)
                     logger.debug("Monitor for %s woken up by trigger", device_id)
-                    self._triggers[device_id].clear()
 
-                    # DEBOUNCING: wait to batch multiple rapid triggers
+                    # DEBOUNCING: leave the trigger set while waiting so rapid
+                    # repeats are absorbed, then consume them all at once
                     await asyncio.sleep(self.debounce_delay)
-                    # Clear again in case more triggers arrived during debounce
-                    self._triggers[device_id].clear()
 
                 except asyncio.TimeoutError:
                     logger.debug("Monitor for %s periodic wakeup", device_id)
-                    self._triggers[device_id].clear()
+
+                trigger.clear()
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 # Increment error count for exponential backoff
-                self._error_counts[device_id] += 1
-                error_count = self._error_counts[device_id]
+                state.error_count += 1
+                error_count = state.error_count
 
                 # Calculate exponential backoff: 5s, 10s, 20s, 40s, 60s (max)
                 backoff = min(5 * (2 ** (error_count - 1)), self.max_backoff)
@@ -272,20 +369,38 @@ class DeviceCoordinator:
                 )
 
                 # Signal ready even on error to not block startup forever
-                self._ready_events[device_id].set()
+                self._mark_ready(device_id, state)
 
                 await asyncio.sleep(backoff)
 
     async def _fetch_params(self, device: Device) -> None:
-        """Fetch all parameters for a device."""
-        # Standard params
-        params = await self.api.get_device_params(device, [])
-        device.params = params
+        """Fetch all parameters for a device.
 
-        # Special params
+        Standard and special params are independent requests, so they are
+        issued concurrently when the product has special params. Only a
+        failed standard request is raised; a failed special request is
+        logged and the standard params are kept.
+        """
         special_list = AuxProducts.get_special_params_list(device.product_id)
-        if special_list:
-            special_params = await self.api.get_device_params(device, special_list)
+        if not special_list:
+            device.params = await self.api.get_device_params(device, [])
+            return
+
+        results = await asyncio.gather(
+            self.api.get_device_params(device, []),
+            self.api.get_device_params(device, special_list),
+            return_exceptions=True,
+        )
+        params, special_params = results
+        if isinstance(params, BaseException):
+            raise params
+        device.params = params
+
+        if isinstance(special_params, BaseException):
+            logger.error(
+                "Error fetching special params for %s: %s", device.endpoint_id, special_params
+            )
+        else:
             device.params.update(special_params)
 
     # --- Control Methods ---
@@ -300,17 +415,16 @@ class DeviceCoordinator:
             await self.api.set_device_params(device, params)
             # Wake up monitor immediately to reflect changes
             self.trigger_update(device.endpoint_id)
-        except APIServerBusyError:
-            raise ServerBusyError() from None
-        except APIDeviceOfflineError as e:
-            raise DeviceOfflineError(device.endpoint_id, device.friendly_name) from e
         except AuxAPIError as e:
-            raise ClimateHubError(str(e)) from e
+            error = _map_control_error(device, e)
+            if isinstance(error, ServerBusyError):
+                # Busy is transient and self-explanatory; hide the API traceback
+                raise error from None
+            raise error from e
 
     async def set_power(self, device_id: str, on: bool) -> None:
         """Set device power state."""
-        params = AC_POWER_ON if on else AC_POWER_OFF
-        await self._execute_control(device_id, params)
+        await self._execute_control(device_id, _POWER_PARAMS[bool(on)])
 
     async def set_temperature(self, device_id: str, temperature: float) -> None:
         """Set target temperature."""
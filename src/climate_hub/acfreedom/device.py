@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection, Iterable, Mapping
+from operator import attrgetter
+
 from climate_hub.acfreedom.exceptions import DeviceNotFoundError
 from climate_hub.api.models import Device
 
+_is_online = attrgetter("is_online")
+_device_type = attrgetter("device_type")
+
 
 class DeviceFinder:
     """Utilities for finding and filtering devices."""
 
     @staticmethod
-    def find_device(devices: list[Device], device_id: str) -> Device:
+    def find_device(devices: Collection[Device], device_id: str) -> Device:
         """Find device by ID or name.
 
         Tries in order:
@@ -19,7 +25,7 @@ class DeviceFinder:
         3. Partial friendly name match (case-insensitive substring)
 
         Args:
-            devices: List of devices to search
+            devices: Devices to search (any sized iterable, e.g. a dict values view)
             device_id: Device ID or name to search for
 
         Returns:
@@ -31,23 +37,67 @@ class DeviceFinder:
         if not devices:
             raise DeviceNotFoundError(device_id)
 
-        # Try exact ID match
+        # Single pass: an exact ID wins immediately, otherwise remember the
+        # first exact and first partial name match (case-insensitive).
+        device_id_lower = device_id.lower()
+        exact_name: Device | None = None
+        partial_name: Device | None = None
         for device in devices:
             if device.endpoint_id == device_id:
                 return device
+            if exact_name is None:
+                name_lower = device.friendly_name_lower
+                if name_lower == device_id_lower:
+                    exact_name = device
+                elif partial_name is None and device_id_lower in name_lower:
+                    partial_name = device
+
+        if exact_name is not None:
+            return exact_name
+        if partial_name is not None:
+            return partial_name
 
-        # Try exact name match (case-insensitive)
-        device_id_lower = device_id.lower()
-        for device in devices:
-            if device.friendly_name.lower() == device_id_lower:
-                return device
+        raise DeviceNotFoundError(device_id)
 
-        # Try partial name match (case-insensitive substring)
+    @staticmethod
+    def index_by_name(devices: Iterable[Device]) -> dict[str, Device]:
+        """Index devices by lowercase friendly name.
+
+        Args:
+            devices: Devices to index
+
+        Returns:
+            Lowercase name to device (first device wins on duplicate names)
+        """
+        by_name: dict[str, Device] = {}
         for device in devices:
-            if device_id_lower in device.friendly_name.lower():
-                return device
+            by_name.setdefault(device.friendly_name_lower, device)
+        return by_name
 
-        raise DeviceNotFoundError(device_id)
+    @staticmethod
+    def find_indexed(
+        by_id: Mapping[str, Device], by_name: Mapping[str, Device], device_id: str
+    ) -> Device:
+        """Find device using prebuilt ID and name indexes.
+
+        Exact ID and exact name matches are O(1); partial name matches fall
+        back to find_device() over the indexed devices.
+
+        Args:
+            by_id: Endpoint ID to device
+            by_name: Lowercase friendly name to device (see index_by_name)
+            device_id: Device ID or name to search for
+
+        Returns:
+            Matching device
+
+        Raises:
+            DeviceNotFoundError: If no device found
+        """
+        device = by_id.get(device_id) or by_name.get(device_id.lower())
+        if device is not None:
+            return device
+        return DeviceFinder.find_device(by_id.values(), device_id)
 
     @staticmethod
     def filter_online(devices: list[Device]) -> list[Device]:
@@ -59,7 +109,7 @@ class DeviceFinder:
         Returns:
             List of online devices only
         """
-        return [d for d in devices if d.is_online]
+        return list(filter(_is_online, devices))
 
     @staticmethod
     def filter_by_type(devices: list[Device], device_type: str) -> list[Device]:
@@ -72,4 +122,4 @@ class DeviceFinder:
         Returns:
             List of matching devices
         """
-        return [d for d in devices if d.device_type == device_type]
+        return [d for d in devices if _device_type(d) == device_type]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 
 class ClimateHubError(Exception):
     """Base exception for all Climate Hub business logic errors."""
@@ -9,54 +11,71 @@ class ClimateHubError(Exception):
     def __init__(self, message: str, details: dict[str, str] | None = None) -> None:
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self._details = details
+
+    @property
+    def details(self) -> dict[str, str]:
+        """Structured error details (built on first access)."""
+        if self._details is None:
+            self._details = self._build_details()
+        return self._details
+
+    def _build_details(self) -> dict[str, str]:
+        """Build the details dict for subclasses that derive it from their fields."""
+        return {}
 
 
 class AuthenticationError(ClimateHubError):
     """Authentication failed."""
 
     def __init__(self, reason: str = "Authentication failed") -> None:
-        super().__init__(f"Authentication error: {reason}", {"reason": reason})
+        super().__init__(f"Authentication error: {reason}")
         self.reason = reason
 
+    def _build_details(self) -> dict[str, str]:
+        return {"reason": self.reason}
+
 
 class DeviceNotFoundError(ClimateHubError):
     """Device not found by ID or name."""
 
     def __init__(self, device_id: str) -> None:
-        super().__init__(
-            f"Device not found: {device_id}",
-            {"device_id": device_id},
-        )
+        super().__init__(f"Device not found: {device_id}")
         self.device_id = device_id
 
+    def _build_details(self) -> dict[str, str]:
+        return {"device_id": self.device_id}
+
 
 class DeviceOfflineError(ClimateHubError):
     """Device is offline and cannot be controlled."""
 
     def __init__(self, device_id: str, device_name: str) -> None:
-        super().__init__(
-            f"Device '{device_name}' is offline",
-            {"device_id": device_id, "device_name": device_name},
-        )
+        super().__init__(f"Device '{device_name}' is offline")
         self.device_id = device_id
         self.device_name = device_name
 
+    def _build_details(self) -> dict[str, str]:
+        return {"device_id": self.device_id, "device_name": self.device_name}
+
 
 class InvalidParameterError(ClimateHubError):
     """Invalid parameter value provided."""
 
     def __init__(
-        self, param_name: str, value: str | int | float, valid_values: list[str] | None = None
+        self, param_name: str, value: str | int | float, valid_values: Sequence[str] | None = None
     ) -> None:
         msg = f"Invalid {param_name}: {value}"
         if valid_values:
             msg += f". Valid values: {', '.join(valid_values)}"
-        super().__init__(msg, {"param_name": param_name, "value": str(value)})
+        super().__init__(msg)
         self.param_name = param_name
         self.value = value
         self.valid_values = valid_values
 
+    def _build_details(self) -> dict[str, str]:
+        return {"param_name": self.param_name, "value": str(self.value)}
+
 
 class ConfigurationError(ClimateHubError):
     """Configuration error (missing or invalid config)."""
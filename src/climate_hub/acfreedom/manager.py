@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from collections.abc import Coroutine
+from collections.abc import AsyncIterator, Coroutine
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from itertools import chain
 from typing import Any, TypeVar
 
 from climate_hub.acfreedom.control import DeviceControl
@@ -16,6 +20,7 @@ from climate_hub.acfreedom.exceptions import (
     ServerBusyError,
 )
 from climate_hub.api.client import AuxCloudAPI
+from climate_hub.api.constants import AC_POWER_OFF, AC_POWER_ON, AC_TEMPERATURE_TARGET
 from climate_hub.api.exceptions import (
     AuthenticationError as APIAuthError,
 )
@@ -38,6 +43,26 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+@dataclass(slots=True)
+class _PendingWrite:
+    """Parameters buffered for one device until the coalescing window closes.
+
+    ``device`` is only a fallback: the flush sends to the device currently
+    cached under the same ID.
+    """
+
+    device: Device
+    future: asyncio.Future[None]
+    handle: asyncio.TimerHandle | None = None
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+def _consume_exception(future: asyncio.Future[None]) -> None:
+    """Retrieve a future's exception so asyncio does not report it as unhandled."""
+    if not future.cancelled():
+        future.exception()
+
+
 class DeviceManager:
     """High-level device management and orchestration."""
 
@@ -50,11 +75,39 @@ class DeviceManager:
         """
         self.api = api_client or AuxCloudAPI(region=region)
         self.families: list[Family] = []
-        self.devices: list[Device] = []
+        self._devices_by_id: dict[str, Device] = {}
+        self._devices_by_name: dict[str, Device] = {}
+        self.devices = []
 
         # Cache management
         self._cache_timestamp: float = 0.0
         self._cache_ttl: int = 60  # seconds (increased from 30 to reduce API calls)
+        # In-flight refresh per `shared` flag, shared by concurrent callers
+        self._refresh_tasks: dict[bool, asyncio.Task[list[Device]]] = {}
+        # Refresh tasks some caller awaits (their errors reach that caller)
+        self._awaited_refreshes: set[asyncio.Task[list[Device]]] = set()
+        # Device IDs last listed per (family ID, shared), kept if a family fails
+        self._family_device_ids: dict[tuple[str, bool], list[str]] = {}
+
+        # Upper bounds on concurrent refresh requests
+        self.max_parallel_families = 10
+        self.max_parallel_param_fetches = 8
+
+        # Writes to the same device within this window are merged (seconds)
+        self.write_coalesce_delay = 0.15
+        self._pending_writes: dict[str, _PendingWrite] = {}
+
+    @property
+    def devices(self) -> list[Device]:
+        """Cached devices from the last refresh."""
+        return self._devices
+
+    @devices.setter
+    def devices(self, devices: list[Device]) -> None:
+        self._devices = devices
+        # Rebuild lookup indexes (first device wins on duplicate names)
+        self._devices_by_id = {d.endpoint_id: d for d in devices}
+        self._devices_by_name = DeviceFinder.index_by_name(devices)
 
     async def login(self, email: str, password: str) -> bool:
         """Login to AUX cloud.
@@ -73,6 +126,11 @@ class DeviceManager:
         """
         return await self._wrap_api_call(self.api.login(email, password))
 
+    async def close(self) -> None:
+        """Send any buffered writes and close the API client's HTTP session."""
+        await self.flush_now()
+        await self.api.close()
+
     def is_logged_in(self) -> bool:
         """Check if logged in.
 
@@ -84,7 +142,9 @@ class DeviceManager:
     async def refresh_devices(self, shared: bool = False) -> list[Device]:
         """Refresh and return all devices with full parameters.
 
-        ALWAYS fetches complete device parameters.
+        ALWAYS fetches complete device parameters. If only some families
+        fail, their devices from the previous refresh are kept (with their
+        last known state) rather than dropped.
 
         Args:
             shared: Include shared devices
@@ -95,25 +155,91 @@ class DeviceManager:
         Raises:
             ClimateHubError: If request fails
         """
-
-        async def _refresh() -> list[Device]:
+        # Concurrent callers await the same refresh instead of each starting one
+        task = self._start_refresh(shared)
+        self._awaited_refreshes.add(task)
+        return await asyncio.shield(task)
+
+    def _start_refresh(self, shared: bool) -> asyncio.Task[list[Device]]:
+        """Return the in-flight refresh task, starting one if none is running."""
+        task = self._refresh_tasks.get(shared)
+        if task is None or task.done():
+            task = asyncio.create_task(self._refresh_devices(shared))
+            task.add_done_callback(self._on_refresh_done)
+            self._refresh_tasks[shared] = task
+        return task
+
+    def _on_refresh_done(self, task: asyncio.Task[list[Device]]) -> None:
+        """Retrieve refresh errors; log those of background refreshes nobody awaits."""
+        awaited = task in self._awaited_refreshes
+        self._awaited_refreshes.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None and not awaited:
+            # Stale devices keep being served, so make the failure visible
+            logger.warning("Background device refresh failed: %s", exc, exc_info=exc)
+
+    async def _refresh_devices(self, shared: bool) -> list[Device]:
+        """Refresh all devices from the API (see refresh_devices)."""
+        limit = asyncio.Semaphore(self.max_parallel_families)
+
+        async def _list_family(family_id: str) -> list[dict[str, Any]]:
+            async with limit:
+                return await self.api.get_devices(family_id, shared)
+
+        async with self._map_errors():
             families_data = await self.api.get_families()
 
-            all_devices: list[Device] = []
+            # Families are independent, so list their devices concurrently
+            results = await asyncio.gather(
+                *(_list_family(family_data["familyid"]) for family_data in families_data),
+                return_exceptions=True,
+            )
+
+            listed: list[tuple[str, list[dict[str, Any]]]] = []
+            failed_ids: list[str] = []
+            errors: list[BaseException] = []
 
-            for family_data in families_data:
+            for family_data, result in zip(families_data, results, strict=True):
                 family_id = family_data["familyid"]
-                # Always fetch params
-                devices_data = await self._get_devices_for_family(
-                    family_id, shared, fetch_params=True
-                )
-                all_devices.extend(devices_data)
+                if isinstance(result, BaseException):
+                    logger.error("Error refreshing family %s: %s", family_id, result)
+                    errors.append(result)
+                    failed_ids.append(family_id)
+                else:
+                    listed.append((family_id, result))
+
+            # Partial results are fine, but a total failure must surface
+            if errors and len(errors) == len(results):
+                raise errors[0]
+
+            # One state query and one param fan-out across all families (always with params)
+            all_raw = list(chain.from_iterable(raw for _, raw in listed))
+            all_devices = await self._load_devices(all_raw, fetch_params=True)
+
+            # Devices come back in listing order, so slice them per family
+            offset = 0
+            for family_id, raw in listed:
+                family_devices = all_devices[offset : offset + len(raw)]
+                offset += len(raw)
+                self._family_device_ids[(family_id, shared)] = [
+                    d.endpoint_id for d in family_devices
+                ]
+
+            # Keep the last known devices of failed families so they stay addressable
+            seen = {d.endpoint_id for d in all_devices}
+            for family_id in failed_ids:
+                for device_id in self._family_device_ids.get((family_id, shared), ()):
+                    previous = self._devices_by_id.get(device_id)
+                    if previous is not None and device_id not in seen:
+                        all_devices.append(previous)
+                        seen.add(device_id)
 
             self.devices = all_devices
+            self._cache_timestamp = time.time()
             return all_devices
 
-        return await self._wrap_api_call(_refresh())
-
     def get_devices(self) -> list[Device]:
         """Get devices from cache (read-only).
 
@@ -127,21 +253,59 @@ class DeviceManager:
             # Get devices from cache
             devices = manager.get_devices()
         """
-        logger.debug(f"Cache READ: returning {len(self.devices)} devices")
+        logger.debug("Cache READ: returning %d devices", len(self.devices))
         return self.devices
 
+    async def get_devices_cached(
+        self, shared: bool = False, ttl: int | None = None
+    ) -> list[Device]:
+        """Get devices with TTL caching and stale-while-revalidate.
+
+        Fresh cache (age < ttl) is returned as-is. Stale cache (age < 2 * ttl)
+        is returned immediately while a background refresh runs. Otherwise
+        the call waits for a refresh, shared with any concurrent callers.
+
+        Args:
+            shared: Include shared devices
+            ttl: Cache TTL in seconds (defaults to the manager TTL)
+
+        Returns:
+            List of devices
+
+        Raises:
+            ClimateHubError: If a blocking refresh fails
+        """
+        ttl = ttl if ttl is not None else self._cache_ttl
+        cache_age = time.time() - self._cache_timestamp
+
+        if self.devices and cache_age < ttl:
+            logger.debug("Cache HIT: age=%.1fs, TTL=%ds", cache_age, ttl)
+            return self.devices
+
+        if self.devices and cache_age < 2 * ttl:
+            logger.debug("Cache STALE: age=%.1fs, revalidating in background", cache_age)
+            self._start_refresh(shared)
+            return self.devices
+
+        logger.debug("Cache MISS: refreshing from API")
+        return await self.refresh_devices(shared)
+
     def invalidate_cache(self) -> None:
         """Force cache invalidation.
 
-        Call this after modifying device state (e.g., turning on/off,
-        changing temperature) to ensure next request gets fresh data.
+        set_* methods already patch the cached device and mark the cache
+        stale, so this is only needed to force a blocking refresh.
 
         Example:
-            await manager.set_temperature("living_room", 22)
             manager.invalidate_cache()  # Next get_devices_cached() will refresh
         """
         logger.debug("Cache invalidated - next request will refresh from API")
         self._cache_timestamp = 0.0
+        self.api.invalidate_families()
+
+    def _expire_cache(self) -> None:
+        """Mark the cache stale so the next cached read revalidates in the background."""
+        self._cache_timestamp = min(self._cache_timestamp, time.time() - self._cache_ttl)
 
     async def _wrap_api_call(self, coro: Coroutine[Any, Any, T]) -> T:
         """Wrap API call to map exceptions.
@@ -152,14 +316,27 @@ class DeviceManager:
         Returns:
             Result of coroutine
 
+        Raises:
+            ServerBusyError: If server is busy
+            DeviceOfflineError: If device is offline
+            ClimateHubError: For other API errors
+        """
+        async with self._map_errors():
+            return await coro
+
+    @asynccontextmanager
+    async def _map_errors(self) -> AsyncIterator[None]:
+        """Map API exceptions raised in the block to Climate Hub exceptions.
+
+        Lets multi-call operations map errors once instead of per request.
+
         Raises:
             ServerBusyError: If server is busy
             DeviceOfflineError: If device is offline
             ClimateHubError: For other API errors
         """
         try:
-            result = await coro
-            return result
+            yield
         except APIServerBusyError:
             raise ServerBusyError() from None
         except APIDeviceOfflineError as e:
@@ -185,32 +362,52 @@ class DeviceManager:
         Returns:
             List of Device objects
         """
-        # Get device list
-        devices_raw = await self._wrap_api_call(self.api.get_devices(family_id, shared))
+        async with self._map_errors():
+            devices_raw = await self.api.get_devices(family_id, shared)
+            return await self._load_devices(devices_raw, fetch_params)
+
+    async def _load_devices(
+        self, devices_raw: list[dict[str, Any]], fetch_params: bool = True
+    ) -> list[Device]:
+        """Build Device objects and populate their state (and params).
 
-        # Convert to Device objects
-        devices = [Device(**dev) for dev in devices_raw]
+        All devices share a single bulk state query, whatever family they
+        belong to. API errors are raised unmapped; callers run this inside
+        _map_errors().
+
+        Args:
+            devices_raw: Raw device dictionaries from get_devices()
+            fetch_params: Whether to fetch device parameters
+
+        Returns:
+            List of Device objects
+        """
+        # Convert to Device objects (API payload, so skip validation)
+        devices = [Device.from_trusted(dev) for dev in devices_raw]
 
         # Query device states
         if devices:
-            device_states = await self._wrap_api_call(self.api.bulk_query_device_state(devices_raw))
+            device_states = await self.api.bulk_query_device_state(devices_raw)
+            state_by_did = {s["did"]: s["state"] for s in device_states["data"]}
 
             for device in devices:
                 # Update state
-                device.state = next(
-                    (
-                        dev_state["state"]
-                        for dev_state in device_states["data"]
-                        if dev_state["did"] == device.endpoint_id
-                    ),
-                    0,
-                )
+                device.state = state_by_did.get(device.endpoint_id, 0)
 
-                # Get parameters if online (only if requested)
-                if fetch_params and device.is_online:
-                    await self.fetch_device_params(device)
+            # Get parameters for online devices concurrently (only if requested)
+            if fetch_params:
+                limit = asyncio.Semaphore(self.max_parallel_param_fetches)
 
-                device.last_updated = time.strftime("%Y-%m-%d %H:%M:%S")
+                async def _fetch(device: Device) -> None:
+                    async with limit:
+                        await self.fetch_device_params(device)
+
+                await asyncio.gather(*(_fetch(d) for d in devices if d.is_online))
+
+            # One timestamp for the whole batch
+            now_str = time.strftime("%Y-%m-%d %H:%M:%S")
+            for device in devices:
+                device.last_updated = now_str
 
         return devices
 
@@ -225,16 +422,28 @@ class DeviceManager:
             device: Device to update (modified in-place)
         """
         try:
-            # Get standard params
-            params = await self._wrap_api_call(self.api.get_device_params(device, []))
+            special_params_list = AuxProducts.get_special_params_list(device.product_id)
+            if not special_params_list:
+                device.params = await self.api.get_device_params(device, [])
+                return
+
+            # Standard and special params are independent requests
+            results = await asyncio.gather(
+                self.api.get_device_params(device, []),
+                self.api.get_device_params(device, special_params_list),
+                return_exceptions=True,
+            )
+            params, special_params = results
+            if isinstance(params, BaseException):
+                raise params
             device.params = params
 
-            # Get special params if available
-            special_params_list = AuxProducts.get_special_params_list(device.product_id)
-            if special_params_list:
-                special_params = await self._wrap_api_call(
-                    self.api.get_device_params(device, special_params_list)
+            # Special params are optional: keep the standard ones if they fail
+            if isinstance(special_params, BaseException):
+                logger.error(
+                    "Error fetching special params for %s: %s", device.endpoint_id, special_params
                 )
+            else:
                 device.params.update(special_params)
 
         except Exception as e:
@@ -252,7 +461,91 @@ class DeviceManager:
         Raises:
             DeviceNotFoundError: If device not found
         """
-        return DeviceFinder.find_device(self.devices, device_id)
+        return DeviceFinder.find_indexed(self._devices_by_id, self._devices_by_name, device_id)
+
+    async def _queue_params(self, device: Device, params: dict[str, Any]) -> None:
+        """Buffer parameters so rapid writes to a device become one request.
+
+        Waits until the merged request has been sent, so API errors still
+        surface to every caller that contributed to it.
+
+        Args:
+            device: Target device
+            params: Parameter name to API value
+        """
+        if self.write_coalesce_delay <= 0:
+            await self._send_params(device, params)
+            return
+
+        pending = self._pending_writes.get(device.endpoint_id)
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            pending = _PendingWrite(device=device, future=loop.create_future())
+            # Mark the error retrieved even if every waiting caller was cancelled
+            pending.future.add_done_callback(_consume_exception)
+            pending.handle = loop.call_later(
+                self.write_coalesce_delay, self._flush, device.endpoint_id
+            )
+            self._pending_writes[device.endpoint_id] = pending
+
+        # Later values win for the same parameter
+        pending.params.update(params)
+        await asyncio.shield(pending.future)
+
+    def _flush(self, device_id: str) -> asyncio.Future[None] | None:
+        """Send the buffered parameters for a device now.
+
+        Returns:
+            Future resolved once the write completes (None if nothing pending)
+        """
+        pending = self._pending_writes.pop(device_id, None)
+        if pending is None:
+            return None
+        if pending.handle is not None:
+            pending.handle.cancel()
+
+        # A refresh may have replaced the Device since the write was queued
+        device = self._devices_by_id.get(device_id, pending.device)
+        future = pending.future
+        task = asyncio.ensure_future(self._send_params(device, pending.params))
+
+        def _resolve(done: asyncio.Task[None]) -> None:
+            if future.done():
+                return
+            if done.cancelled():
+                future.cancel()
+            elif (exc := done.exception()) is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(None)
+
+        task.add_done_callback(_resolve)
+        return future
+
+    async def flush_now(self) -> None:
+        """Send all buffered writes immediately and wait for them."""
+        futures = [f for did in list(self._pending_writes) if (f := self._flush(did))]
+        if futures:
+            await asyncio.gather(*futures, return_exceptions=True)
+
+    async def _send_params(self, device: Device, params: dict[str, Any]) -> None:
+        """Send parameters to a device, skipping writes that change nothing.
+
+        Args:
+            device: Target device
+            params: Parameter name to API value
+        """
+        current = device.params
+        # Without cached params we cannot tell, so always send
+        if current and all(current.get(name) == value for name, value in params.items()):
+            logger.debug("Skipping no-op update for %s: %s", device.endpoint_id, params)
+            return
+
+        await self._wrap_api_call(self.api.set_device_params(device, params))
+
+        # Reflect the write locally so reads see it before the next refresh
+        current.update(params)
+        self._expire_cache()
 
     async def set_power(self, device_id: str, on: bool) -> None:
         """Turn device on or off.
@@ -270,10 +563,8 @@ class DeviceManager:
         if not device.is_online:
             raise DeviceOfflineError(device.endpoint_id, device.friendly_name)
 
-        from climate_hub.api.constants import AC_POWER_OFF, AC_POWER_ON
-
         params = AC_POWER_ON if on else AC_POWER_OFF
-        await self._wrap_api_call(self.api.set_device_params(device, params))
+        await self._queue_params(device, params)
 
     async def set_temperature(self, device_id: str, temperature: float) -> None:
         """Set target temperature.
@@ -294,11 +585,9 @@ class DeviceManager:
 
         DeviceControl.validate_temperature(temperature)
 
-        from climate_hub.api.constants import AC_TEMPERATURE_TARGET
-
         # Convert to tenths (API expects temperature * 10, e.g., 22.0°C -> 220)
         params = {AC_TEMPERATURE_TARGET: int(temperature * 10)}
-        await self._wrap_api_call(self.api.set_device_params(device, params))
+        await self._queue_params(device, params)
 
     async def set_mode(self, device_id: str, mode: str) -> None:
         """Set operation mode.
@@ -318,7 +607,7 @@ class DeviceManager:
             raise DeviceOfflineError(device.endpoint_id, device.friendly_name)
 
         params = DeviceControl.validate_mode(mode)
-        await self._wrap_api_call(self.api.set_device_params(device, params))
+        await self._queue_params(device, params)
 
     async def set_fan_speed(self, device_id: str, speed: str) -> None:
         """Set fan speed.
@@ -338,7 +627,7 @@ class DeviceManager:
             raise DeviceOfflineError(device.endpoint_id, device.friendly_name)
 
         params = DeviceControl.validate_fan_speed(speed)
-        await self._wrap_api_call(self.api.set_device_params(device, params))
+        await self._queue_params(device, params)
 
     async def set_swing(self, device_id: str, direction: str, on: bool) -> None:
         """Set swing (oscillation).
@@ -360,4 +649,4 @@ class DeviceManager:
 
         DeviceControl.validate_swing_direction(direction)
         params = DeviceControl.get_swing_params(direction, on)
-        await self._wrap_api_call(self.api.set_device_params(device, params))
+        await self._queue_params(device, params)
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
 import time
+from collections.abc import Mapping, Sequence
 from typing import Any, cast
 
 import aiohttp
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from climate_hub.api import constants as C
+from climate_hub.api import jsonutil
 from climate_hub.api.crypto import encrypt_aes_cbc_zero_padding
 from climate_hub.api.exceptions import (
     AuthenticationError,
@@ -39,26 +42,140 @@ from climate_hub.api.types import (
 
 logger = logging.getLogger(__name__)
 
+# API server base URL per region
+_REGION_URLS: dict[str, str] = {
+    "eu": C.API_SERVER_URL_EU,
+    "usa": C.API_SERVER_URL_USA,
+    "cn": C.API_SERVER_URL_CN,
+}
+
+# Login signing keys, encoded once
+_PASSWORD_KEY = C.PASSWORD_ENCRYPT_KEY.encode()
+_BODY_KEY = C.BODY_ENCRYPT_KEY.encode()
+_TIMESTAMP_KEY = C.TIMESTAMP_TOKEN_ENCRYPT_KEY.encode()
+
+# Header values that never change between requests
+_STATIC_HEADERS: dict[str, str] = {
+    "Content-Type": "application/x-java-serialized-object",
+    "licenseId": C.LICENSE_ID,
+    "lid": C.LICENSE_ID,
+    "language": "en",
+    "appVersion": C.SPOOF_APP_VERSION,
+    "User-Agent": C.SPOOF_USER_AGENT,
+    "system": C.SPOOF_SYSTEM,
+    "appPlatform": C.SPOOF_APP_PLATFORM,
+}
+
 
 class AuxCloudAPI:
     """Client for AUX Cloud API."""
 
-    def __init__(self, region: str = "eu") -> None:
+    def __init__(self, region: str = "eu", max_concurrency: int = 8) -> None:
         """Initialize API client.
 
         Args:
             region: API region (eu, usa, cn)
+            max_concurrency: Maximum number of requests in flight at once
         """
-        self.url = {
-            "eu": C.API_SERVER_URL_EU,
-            "usa": C.API_SERVER_URL_USA,
-            "cn": C.API_SERVER_URL_CN,
-        }.get(region, C.API_SERVER_URL_EU)
+        self.url = _REGION_URLS.get(region, C.API_SERVER_URL_EU)
+        self._endpoint_base = f"{self.url}/"
 
         self.region = region
         self.loginsession: str | None = None
         self.userid: str | None = None
 
+        # Shared HTTP session (created lazily on the running event loop)
+        self.max_concurrency = max_concurrency
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+        self._request_limit: asyncio.Semaphore | None = None
+
+        # Family lists rarely change, so get_families() results are reused
+        self.families_ttl: float = 300.0  # seconds
+        self._families_cache: tuple[float, list[FamilyInfo]] | None = None
+
+    async def __aenter__(self) -> AuxCloudAPI:
+        """Async context manager entry.
+
+        Returns:
+            Self for context manager usage
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any,
+    ) -> None:
+        """Async context manager exit - close the HTTP session.
+
+        Args:
+            exc_type: Exception type if raised
+            exc_val: Exception value if raised
+            exc_tb: Exception traceback if raised
+        """
+        await self.close()
+
+    def _get_session(self) -> tuple[aiohttp.ClientSession, asyncio.Semaphore]:
+        """Get the shared HTTP session and request limiter, creating them if needed.
+
+        Reusing one session keeps connections (and TLS sessions) pooled
+        across requests. A new session is created if the previous one was
+        closed or belongs to another event loop.
+
+        Returns:
+            HTTP client session and the semaphore bounding in-flight requests
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._request_limit is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            self._release_stale_session()
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=self.max_concurrency,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                ),
+                timeout=aiohttp.ClientTimeout(total=15),
+            )
+            self._session_loop = loop
+            # Bursts beyond this tend to trigger ServerBusy retries
+            self._request_limit = asyncio.Semaphore(self.max_concurrency)
+        return self._session, self._request_limit
+
+    def _release_stale_session(self) -> None:
+        """Close a session left behind by another event loop before replacing it.
+
+        Its connections belong to that loop, so they are closed there while
+        it is still running. Otherwise the connector is detached and closed
+        in place; a finished loop has nothing left to flush.
+        """
+        session, session_loop = self._session, self._session_loop
+        if session is None or session.closed:
+            return
+        if session_loop is not None and session_loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+            return
+        connector = session.connector
+        session.detach()
+        if connector is not None:
+            # close() returns a waiter bound to the old loop; _close() is its synchronous part
+            connector._close()
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+        self._request_limit = None
+
     @property
     def headers(self) -> dict[str, str]:
         """Get API headers.
@@ -78,14 +195,7 @@ class AuxCloudAPI:
             Headers dictionary
         """
         return {
-            "Content-Type": "application/x-java-serialized-object",
-            "licenseId": C.LICENSE_ID,
-            "lid": C.LICENSE_ID,
-            "language": "en",
-            "appVersion": C.SPOOF_APP_VERSION,
-            "User-Agent": C.SPOOF_USER_AGENT,
-            "system": C.SPOOF_SYSTEM,
-            "appPlatform": C.SPOOF_APP_PLATFORM,
+            **_STATIC_HEADERS,
             "loginsession": self.loginsession or "",
             "userid": self.userid or "",
             **kwargs,
@@ -104,7 +214,7 @@ class AuxCloudAPI:
         headers: dict[str, str] | None = None,
         data: dict[str, Any] | None = None,
         data_raw: str | bytes | None = None,
-        params: dict[str, str] | None = None,
+        params: Mapping[str, str] | None = None,
         ssl: bool = False,
     ) -> dict[str, Any]:
         """Make HTTP request to API.
@@ -124,19 +234,19 @@ class AuxCloudAPI:
         Raises:
             AuxAPIError: If request fails
         """
-        url = f"{self.url}/{endpoint}"
+        url = self._endpoint_base + endpoint
         logger.debug("Making %s request to %s", method, endpoint)
 
-        timeout = aiohttp.ClientTimeout(total=15)
+        session, request_limit = self._get_session()
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session, session.request(
+            async with request_limit, session.request(
                 method=method,
                 url=url,
                 headers=headers,
                 data=(
                     data_raw
                     if data_raw
-                    else json.dumps(data, separators=(",", ":"))
+                    else jsonutil.dumpb(data)
                     if data
                     else None
                 ),
@@ -144,9 +254,10 @@ class AuxCloudAPI:
                 ssl=ssl,
             ) as response:
                 response.raise_for_status()
-                response_text = await response.text()
+                # Parse the raw body; no intermediate str decode
+                response_body = await response.read()
                 try:
-                    json_data = cast(dict[str, Any], json.loads(response_text))
+                    json_data = cast(dict[str, Any], jsonutil.loads(response_body))
 
                     # Check for logical errors in response
                     status = json_data.get("status")
@@ -162,7 +273,9 @@ class AuxCloudAPI:
 
                     return json_data
                 except json.JSONDecodeError as exc:
-                    raise AuxAPIError(f"Failed to parse JSON response: {response_text}") from exc
+                    raise AuxAPIError(
+                        f"Failed to parse JSON response: {response_body.decode(errors='replace')}"
+                    ) from exc
         except aiohttp.ClientError as exc:
             raise NetworkError(f"Network error: {exc}") from exc
 
@@ -181,8 +294,10 @@ class AuxCloudAPI:
         """
         current_time = time.time()  # Keep as float for timestamp precision
 
-        # Hash password
-        sha_password = hashlib.sha1(f"{password}{C.PASSWORD_ENCRYPT_KEY}".encode()).hexdigest()
+        # Hash password (SHA-1/MD5 are protocol requirements, not a security boundary)
+        sha = hashlib.sha1(password.encode(), usedforsecurity=False)
+        sha.update(_PASSWORD_KEY)
+        sha_password = sha.hexdigest()
 
         payload = {
             "email": email,
@@ -190,18 +305,20 @@ class AuxCloudAPI:
             "companyid": C.COMPANY_ID,
             "lid": C.LICENSE_ID,
         }
-        json_payload = json.dumps(payload, separators=(",", ":"))
+        json_payload = jsonutil.dumpb(payload)
 
         # Token for request validation
-        token = hashlib.md5(f"{json_payload}{C.BODY_ENCRYPT_KEY}".encode()).hexdigest()
+        token_hash = hashlib.md5(json_payload, usedforsecurity=False)
+        token_hash.update(_BODY_KEY)
+        token = token_hash.hexdigest()
 
         # Encryption key from timestamp
-        md5_key = hashlib.md5(f"{current_time}{C.TIMESTAMP_TOKEN_ENCRYPT_KEY}".encode()).digest()
+        key_hash = hashlib.md5(f"{current_time}".encode(), usedforsecurity=False)
+        key_hash.update(_TIMESTAMP_KEY)
+        md5_key = key_hash.digest()
 
         # Encrypt payload
-        encrypted_data = encrypt_aes_cbc_zero_padding(
-            C.AES_INITIAL_VECTOR, md5_key, json_payload.encode()
-        )
+        encrypted_data = encrypt_aes_cbc_zero_padding(C.AES_INITIAL_VECTOR, md5_key, json_payload)
 
         json_data = cast(
             LoginResponse,
@@ -217,6 +334,7 @@ class AuxCloudAPI:
         if json_data.get("status") == 0:
             self.loginsession = json_data["loginsession"]
             self.userid = json_data["userid"]
+            self.invalidate_families()
             logger.info("Login successful for user %s", email)
             return True
 
@@ -230,15 +348,25 @@ class AuxCloudAPI:
         """
         return self.loginsession is not None and self.userid is not None
 
+    def invalidate_families(self) -> None:
+        """Drop the cached family list so the next get_families() refetches."""
+        self._families_cache = None
+
     async def get_families(self) -> list[FamilyInfo]:
         """Get list of families.
 
+        Results are cached for ``families_ttl`` seconds (reset on login).
+
         Returns:
             List of family dictionaries
 
         Raises:
             AuxAPIError: If request fails
         """
+        cached = self._families_cache
+        if cached is not None and time.monotonic() - cached[0] < self.families_ttl:
+            return cached[1]
+
         logger.debug("Getting families list")
 
         json_data = cast(
@@ -252,7 +380,9 @@ class AuxCloudAPI:
         )
 
         if json_data.get("status") == 0:
-            return json_data["data"]["familyList"]
+            families = json_data["data"]["familyList"]
+            self._families_cache = (time.monotonic(), families)
+            return families
 
         raise AuxAPIError(f"Failed to get families: {json_data}")
 
@@ -334,19 +464,10 @@ class AuxCloudAPI:
         Raises:
             AuxAPIError: If request fails
         """
-        queried_device = [{"did": device_id, "devSession": dev_session}]
-        data = build_query_state_request(queried_device, self.userid or "")
-
-        json_data = await self._make_request(
-            method="POST",
-            endpoint="device/control/v2/querystate",
-            data=data,
-            headers=self._get_headers(),
-            ssl=False,
+        return await self.bulk_query_device_state(
+            [{"endpointId": device_id, "devSession": dev_session}]
         )
 
-        return parse_state_response(json_data)
-
     async def bulk_query_device_state(self, devices: list[dict[str, str]]) -> DeviceStatePayload:
         """Query multiple device states in one request.
 
@@ -375,7 +496,7 @@ class AuxCloudAPI:
         return parse_state_response(json_data)
 
     async def get_device_params(
-        self, device: Any, params: list[str] | None = None
+        self, device: Any, params: Sequence[str] | None = None
     ) -> dict[str, Any]:
         """Get device parameters.
 
@@ -389,10 +510,7 @@ class AuxCloudAPI:
         Raises:
             AuxAPIError: If request fails
         """
-        if params is None:
-            params = []
-
-        data = build_control_request(device, "get", params)
+        data = build_control_request(device, "get", params or ())
 
         json_data = await self._make_request(
             method="POST",
@@ -418,7 +536,8 @@ class AuxCloudAPI:
         Raises:
             AuxAPIError: If request fails
         """
-        params = list(values.keys())
+        # Each value must be wrapped as [{"idx": 1, "val": v}] by the protocol
+        params = list(values)
         vals = [[{"idx": 1, "val": v}] for v in values.values()]
 
         data = build_control_request(device, "set", params, vals)
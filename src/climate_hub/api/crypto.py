@@ -1,8 +1,27 @@
-"""Cryptography utilities for AUX Cloud API."""
+"""Cryptography utilities for AUX Cloud API.
+
+AES runs on ``cryptography`` (OpenSSL, AES-NI where available) when it is
+installed, falling back to PyCryptodome otherwise.
+"""
 
 from __future__ import annotations
 
-from Crypto.Cipher import AES
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+    HAS_CRYPTOGRAPHY = True
+except ImportError:  # pragma: no cover - depends on installed extras
+    from Crypto.Cipher import AES
+
+    HAS_CRYPTOGRAPHY = False
+
+
+def _encrypt_cbc(iv: bytes, key: bytes, data: bytes | bytearray) -> bytes:
+    """Encrypt block-aligned data with AES-CBC (no padding applied)."""
+    if HAS_CRYPTOGRAPHY:
+        encryptor = Cipher(algorithms.AES(key), modes.CBC(iv)).encryptor()
+        return encryptor.update(data) + encryptor.finalize()
+    return AES.new(key, AES.MODE_CBC, iv).encrypt(data)  # type: ignore
 
 
 def encrypt_aes_cbc_zero_padding(iv: bytes, key: bytes, data: bytes) -> bytes:
@@ -16,12 +35,12 @@ def encrypt_aes_cbc_zero_padding(iv: bytes, key: bytes, data: bytes) -> bytes:
     Returns:
         Encrypted data as bytes
     """
-    cipher = AES.new(key, AES.MODE_CBC, iv)
     # Zero padding to make data length a multiple of 16
-    remainder = len(data) % 16
-    if remainder != 0:
-        padding_length = 16 - remainder
-        padded_data = data + (b"\x00" * padding_length)
-    else:
-        padded_data = data
-    return cipher.encrypt(padded_data)  # type: ignore
+    length = len(data)
+    padded_length = (length + 15) & ~15
+    if padded_length == length:
+        return _encrypt_cbc(iv, key, data)
+    # bytearray() is zero-filled, so only the data needs copying in
+    padded_data = bytearray(padded_length)
+    padded_data[:length] = data
+    return _encrypt_cbc(iv, key, padded_data)
@@ -0,0 +1,47 @@
+"""JSON helpers for AUX Cloud API payloads.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Both produce compact output and raise json.JSONDecodeError
+(orjson.JSONDecodeError subclasses it) on malformed input.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_ORJSON = False
+
+
+if HAS_ORJSON:
+
+    def loads(data: str | bytes) -> Any:
+        """Parse JSON from str or bytes."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Serialize to compact JSON text."""
+        return orjson.dumps(obj).decode()
+
+    def dumpb(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+else:  # pragma: no cover - depends on the environment
+
+    def loads(data: str | bytes) -> Any:
+        """Parse JSON from str or bytes."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Serialize to compact JSON text."""
+        return json.dumps(obj, separators=(",", ":"))
+
+    def dumpb(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode()
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from enum import Enum, IntEnum
+from functools import cache
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
 
 
 class Region(str, Enum):
@@ -70,14 +71,25 @@ class Room(BaseModel):
     name: str
 
 
+# Name used for devices the API reports without one
+_DEFAULT_FRIENDLY_NAME = "Unnamed"
+
+
 class Device(BaseModel):
     """Air conditioner or heat pump device."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    # Devices are mutated in place and shared by reference (e.g. inside a
+    # Family), so never copy/revalidate instances or validate assignments
+    model_config = ConfigDict(
+        populate_by_name=True,
+        revalidate_instances="never",
+        validate_assignment=False,
+        extra="ignore",
+    )
 
     endpoint_id: str = Field(alias="endpointId")
     product_id: str = Field(alias="productId")
-    friendly_name: str = Field(default="Unnamed", alias="friendlyName")
+    friendly_name: str = Field(default=_DEFAULT_FRIENDLY_NAME, alias="friendlyName")
     mac: str
     dev_session: str = Field(alias="devSession")
     device_type_flag: int = Field(alias="devicetypeFlag")
@@ -86,6 +98,42 @@ class Device(BaseModel):
     params: dict[str, Any] = Field(default_factory=dict)
     last_updated: str | None = None
 
+    # (friendly_name, friendly_name.lower()) memo for case-insensitive lookups
+    _name_lower: tuple[str, str] | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> Device:
+        """Build a Device from an API device-list entry without validation.
+
+        The device list comes from the AUX Cloud API with known field types,
+        so field validation is skipped (aliases and defaults still apply,
+        unknown keys are ignored). A null ``friendlyName`` is replaced by the
+        field default so the name is always a string. Entries missing a
+        required key fall back to full validation, so they fail loudly
+        instead of yielding a half-built Device. Use the regular constructor
+        for data from any other source.
+
+        Args:
+            data: Raw device dictionary (API aliases, e.g. ``endpointId``)
+
+        Returns:
+            Device instance
+        """
+        if "friendlyName" in data and data["friendlyName"] is None:
+            data = {**data, "friendlyName": _DEFAULT_FRIENDLY_NAME}
+        if not _DEVICE_REQUIRED_KEYS.issubset(data):
+            return cls.model_validate(data)
+        return cls.model_construct(**data)
+
+    @property
+    def friendly_name_lower(self) -> str:
+        """Lowercased friendly name, recomputed only when the name changes."""
+        cached = self._name_lower
+        if cached is None or cached[0] is not self.friendly_name:
+            cached = (self.friendly_name, self.friendly_name.lower())
+            self._name_lower = cached
+        return cached[1]
+
     @property
     def is_online(self) -> bool:
         """Check if device is online."""
@@ -94,14 +142,7 @@ class Device(BaseModel):
     @property
     def device_type(self) -> str:
         """Determine device type from product ID."""
-        if self.product_id in [
-            "000000000000000000000000c0620000",
-            "0000000000000000000000002a4e0000",
-        ]:
-            return DeviceType.AC_GENERIC
-        if self.product_id == "000000000000000000000000c3aa0000":
-            return DeviceType.HEAT_PUMP
-        return DeviceType.UNKNOWN
+        return _PRODUCT_TYPES.get(self.product_id, DeviceType.UNKNOWN)
 
     def get_temperature_target(self) -> float | None:
         """Get target temperature in Celsius (converts from tenths)."""
@@ -118,10 +159,25 @@ class Device(BaseModel):
         return None
 
 
+# API keys Device.from_trusted() needs before it may skip validation
+_DEVICE_REQUIRED_KEYS = frozenset(
+    field.alias or name for name, field in Device.model_fields.items() if field.is_required()
+)
+
+# Validator for device lists, built once instead of per call
+DEVICE_LIST_ADAPTER: TypeAdapter[list[Device]] = TypeAdapter(list[Device])
+
+
 class Family(BaseModel):
     """Family/group of devices."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    # Keep the cached Device instances by reference
+    model_config = ConfigDict(
+        populate_by_name=True,
+        revalidate_instances="never",
+        validate_assignment=False,
+        extra="ignore",
+    )
 
     family_id: str = Field(alias="familyid")
     name: str
@@ -129,27 +185,6 @@ class Family(BaseModel):
     devices: list[Device] = Field(default_factory=list)
 
 
-class DirectiveHeader(BaseModel):
-    """Directive header for API requests."""
-
-    model_config = ConfigDict(populate_by_name=True)
-
-    namespace: str
-    name: str
-    interface_version: str = Field(default="2", alias="interfaceVersion")
-    sender_id: str = Field(default="sdk", alias="senderId")
-    message_id: str = Field(alias="messageId")
-
-
-class DeviceDirective(BaseModel):
-    """Device control directive."""
-
-    model_config = ConfigDict(populate_by_name=True)
-
-    did: str
-    dev_session: str = Field(alias="devSession")
-
-
 class Credentials(BaseModel):
     """User credentials for API authentication."""
 
@@ -170,14 +205,16 @@ class AuxProducts:
     """Product type definitions and parameter mappings."""
 
     # Device type product IDs
-    AC_GENERIC_IDS = [
-        "000000000000000000000000c0620000",
-        "0000000000000000000000002a4e0000",
-    ]
-    HEAT_PUMP_IDS = ["000000000000000000000000c3aa0000"]
+    AC_GENERIC_IDS: frozenset[str] = frozenset(
+        {
+            "000000000000000000000000c0620000",
+            "0000000000000000000000002a4e0000",
+        }
+    )
+    HEAT_PUMP_IDS: frozenset[str] = frozenset({"000000000000000000000000c3aa0000"})
 
     # AC parameters list
-    AC_PARAMS = [
+    AC_PARAMS: tuple[str, ...] = (
         "ac_astheat",
         "ac_clean",
         "ac_hdir",
@@ -203,13 +240,13 @@ class AuxProducts:
         "ac_errcode1",
         "tempunit",
         "tenelec",
-    ]
+    )
 
     # AC special parameters
-    AC_SPECIAL_PARAMS = ["mode"]
+    AC_SPECIAL_PARAMS: tuple[str, ...] = ("mode",)
 
     # Heat Pump parameters
-    HP_PARAMS = [
+    HP_PARAMS: tuple[str, ...] = (
         "ac_errcode1",
         "ac_mode",
         "ac_pwr",
@@ -221,14 +258,15 @@ class AuxProducts:
         "hp_hotwater_temp",
         "hp_pwr",
         "qtmode",
-    ]
+    )
 
     # Heat Pump special parameters
-    HP_SPECIAL_PARAMS = ["hp_water_tank_temp"]
+    HP_SPECIAL_PARAMS: tuple[str, ...] = ("hp_water_tank_temp",)
 
     @staticmethod
+    @cache
     def get_device_name(product_id: str) -> str:
-        """Get device name from product ID."""
+        """Get device name from product ID (memoized per product ID)."""
         if product_id in AuxProducts.AC_GENERIC_IDS:
             return "AUX Air Conditioner"
         if product_id in AuxProducts.HEAT_PUMP_IDS:
@@ -236,8 +274,9 @@ class AuxProducts:
         return "Unknown"
 
     @staticmethod
-    def get_params_list(product_id: str) -> list[str] | None:
-        """Get parameter list for product ID."""
+    @cache
+    def get_params_list(product_id: str) -> tuple[str, ...] | None:
+        """Get parameter list for product ID (memoized per product ID)."""
         if product_id in AuxProducts.AC_GENERIC_IDS:
             return AuxProducts.AC_PARAMS
         if product_id in AuxProducts.HEAT_PUMP_IDS:
@@ -245,10 +284,18 @@ class AuxProducts:
         return None
 
     @staticmethod
-    def get_special_params_list(product_id: str) -> list[str] | None:
-        """Get special parameter list for product ID."""
+    @cache
+    def get_special_params_list(product_id: str) -> tuple[str, ...] | None:
+        """Get special parameter list for product ID (memoized per product ID)."""
         if product_id in AuxProducts.AC_GENERIC_IDS:
             return AuxProducts.AC_SPECIAL_PARAMS
         if product_id in AuxProducts.HEAT_PUMP_IDS:
             return AuxProducts.HP_SPECIAL_PARAMS
         return None
+
+
+# Product ID to device type (see AuxProducts)
+_PRODUCT_TYPES: dict[str, str] = {
+    **dict.fromkeys(AuxProducts.AC_GENERIC_IDS, DeviceType.AC_GENERIC),
+    **dict.fromkeys(AuxProducts.HEAT_PUMP_IDS, DeviceType.HEAT_PUMP),
+}
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import base64
-import json
+import itertools
 import time
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, cast
 
+from climate_hub.api import jsonutil
 from climate_hub.api.constants import LICENSE
 from climate_hub.api.models import Device
 from climate_hub.api.types import (
@@ -16,33 +20,24 @@ from climate_hub.api.types import (
     StateResponse,
 )
 
-
-def build_directive_header(
-    namespace: str,
-    name: str,
-    message_id_prefix: str,
-    **kwargs: str,
-) -> dict[str, str]:
-    """Build directive header for API requests.
-
-    Args:
-        namespace: API namespace (e.g., "DNA.QueryState")
-        name: API command name (e.g., "queryState")
-        message_id_prefix: Prefix for message ID (typically userid)
-        **kwargs: Additional header fields
-
-    Returns:
-        Directive header dictionary
-    """
-    timestamp = int(time.time())
-    return {
-        "namespace": namespace,
-        "name": name,
-        "interfaceVersion": "2",
-        "senderId": "sdk",
-        "messageId": f"{message_id_prefix}-{timestamp}",
-        **kwargs,
-    }
+# Unique, increasing messageId suffixes (millisecond-based start, no clock read
+# per call). messageIds are no longer derived from a request timestamp.
+_message_ids = itertools.count(int(time.time() * 1000))
+
+# Static directive header fields per request type (messageId is added per call)
+_QUERY_STATE_HEADER: dict[str, str] = {
+    "namespace": "DNA.QueryState",
+    "name": "queryState",
+    "interfaceVersion": "2",
+    "senderId": "sdk",
+    "messageType": "controlgw.batch",
+}
+_CONTROL_HEADER: dict[str, str] = {
+    "namespace": "DNA.KeyValueControl",
+    "name": "KeyValueControl",
+    "interfaceVersion": "2",
+    "senderId": "sdk",
+}
 
 
 def build_query_state_request(
@@ -51,6 +46,9 @@ def build_query_state_request(
 ) -> dict[str, Any]:
     """Build request to query device states.
 
+    The messageId suffix comes from the module-wide message counter; only the
+    ``timstamp`` header field carries the current Unix time.
+
     Args:
         devices: List of devices with 'did' and 'devSession' keys
         userid: User ID for message ID prefix
@@ -61,26 +59,78 @@ def build_query_state_request(
     timestamp = int(time.time())
     return {
         "directive": {
-            "header": build_directive_header(
-                namespace="DNA.QueryState",
-                name="queryState",
-                messageType="controlgw.batch",
-                message_id_prefix=userid,
-                timstamp=f"{timestamp}",
-            ),
+            "header": {
+                **_QUERY_STATE_HEADER,
+                "messageId": f"{userid}-{next(_message_ids)}",
+                "timstamp": f"{timestamp}",
+            },
             "payload": {"studata": devices, "msgtype": "batch"},
         }
     }
 
 
+@lru_cache(maxsize=512)
+def _build_paired_info(
+    cookie: str,
+    dev_session: str,
+    endpoint_id: str,
+    product_id: str,
+    mac: str,
+    device_type_flag: int,
+) -> dict[str, Any]:
+    """Build the static ``devicePairedInfo`` block sent with control requests.
+
+    Memoized: the inputs only change when the device is re-discovered
+    (e.g. a new devSession), so steady-state polling skips the base64/JSON
+    round-trips of the mapped cookie and reuses the same dict. The result
+    is shared between requests and must not be mutated.
+
+    Args:
+        cookie: Device cookie from the device list (base64 JSON)
+        dev_session: Device session token
+        endpoint_id: Device endpoint ID
+        product_id: Device product ID
+        mac: Device MAC address
+        device_type_flag: Device type flag
+
+    Returns:
+        devicePairedInfo dictionary including the base64-encoded mapped cookie
+    """
+    decoded = jsonutil.loads(base64.b64decode(cookie))
+    mapped_cookie = base64.b64encode(
+        jsonutil.dumpb(
+            {
+                "device": {
+                    "id": decoded["terminalid"],
+                    "key": decoded["aeskey"],
+                    "devSession": dev_session,
+                    "aeskey": decoded["aeskey"],
+                    "did": endpoint_id,
+                    "pid": product_id,
+                    "mac": mac,
+                }
+            }
+        )
+    ).decode()
+    return {
+        "did": endpoint_id,
+        "pid": product_id,
+        "mac": mac,
+        "devicetypeflag": device_type_flag,
+        "cookie": mapped_cookie,
+    }
+
+
 def build_control_request(
     device: Device,
     action: str,
-    params: list[str],
+    params: Sequence[str],
     vals: list[list[dict[str, int]]] | None = None,
 ) -> dict[str, Any]:
     """Build device control request.
 
+    The messageId suffix comes from the module-wide message counter.
+
     Args:
         device: Device object
         action: Action type ("get" or "set")
@@ -93,24 +143,14 @@ def build_control_request(
     if vals is None:
         vals = []
 
-    # Decode cookie and build mapped cookie
-    cookie = json.loads(base64.b64decode(device.cookie.encode()))
-    mapped_cookie = base64.b64encode(
-        json.dumps(
-            {
-                "device": {
-                    "id": cookie["terminalid"],
-                    "key": cookie["aeskey"],
-                    "devSession": device.dev_session,
-                    "aeskey": cookie["aeskey"],
-                    "did": device.endpoint_id,
-                    "pid": device.product_id,
-                    "mac": device.mac,
-                }
-            },
-            separators=(",", ":"),
-        ).encode()
-    ).decode()
+    paired_info = _build_paired_info(
+        device.cookie,
+        device.dev_session,
+        device.endpoint_id,
+        device.product_id,
+        device.mac,
+        device.device_type_flag,
+    )
 
     payload: dict[str, Any] = {
         "act": action,
@@ -125,19 +165,12 @@ def build_control_request(
 
     return {
         "directive": {
-            "header": build_directive_header(
-                namespace="DNA.KeyValueControl",
-                name="KeyValueControl",
-                message_id_prefix=device.endpoint_id,
-            ),
+            "header": {
+                **_CONTROL_HEADER,
+                "messageId": f"{device.endpoint_id}-{next(_message_ids)}",
+            },
             "endpoint": {
-                "devicePairedInfo": {
-                    "did": device.endpoint_id,
-                    "pid": device.product_id,
-                    "mac": device.mac,
-                    "devicetypeflag": device.device_type_flag,
-                    "cookie": mapped_cookie,
-                },
+                "devicePairedInfo": paired_info,
                 "endpointId": device.endpoint_id,
                 "cookie": {},
                 "devSession": device.dev_session,
@@ -235,19 +268,22 @@ def parse_control_response(response: dict[str, Any]) -> dict[str, Any]:
     if "data" not in payload:
         raise ValueError(f"Invalid control response: {response}")
 
-    data = cast(ControlData, json.loads(payload["data"]))
-    result: dict[str, Any] = {}
+    data = cast(ControlData, jsonutil.loads(payload["data"]))
+    params, vals = data["params"], data["vals"]
+    if len(params) != len(vals):
+        raise ValueError(f"Invalid control response: {response}")
+    return {param: val[0]["val"] for param, val in zip(params, vals, strict=True)}
 
-    for i in range(len(data["params"])):
-        result[data["params"][i]] = data["vals"][i][0]["val"]
 
-    return result
+# Read-only, so the same mapping can be passed to every request
+_LICENSE_PARAM: Mapping[str, str] = MappingProxyType({"license": LICENSE})
 
 
-def get_license_param() -> dict[str, str]:
+def get_license_param() -> Mapping[str, str]:
     """Get license query parameter.
 
     Returns:
-        Dictionary with license parameter
+        Read-only mapping with the license parameter (copy with ``dict()``
+        before modifying)
     """
-    return {"license": LICENSE}
+    return _LICENSE_PARAM
@@ -4,18 +4,53 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import logging
+import random
+import socket
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Coroutine
 from typing import Any
 
 import aiohttp
 
 from climate_hub.api import constants as C
+from climate_hub.api import jsonutil
 
 logger = logging.getLogger(__name__)
 
+# Pre-encoded keep-alive frame; only the (digits-only) messageid varies
+_PING_PREFIX = '{"messageid":"'
+_PING_SUFFIX = '","msgtype":"ping"}'
+
+# TCP keepalive: probe after 10s idle, every 5s, give up after 3 misses, so a
+# silently dead peer is noticed in ~25s instead of the OS default (~2h)
+_TCP_KEEPALIVE_OPTIONS = (
+    ("TCP_KEEPIDLE", 10),
+    ("TCP_KEEPINTVL", 5),
+    ("TCP_KEEPCNT", 3),
+)
+
+# Markers of a successful keep-alive response, matched before full parsing
+_PINGK_MARKER = '"msgtype":"pingk"'
+_STATUS_OK_MARKERS = ('"status":0,', '"status":0}')
+
+
+def _is_ping_ack(raw: str) -> bool:
+    """Cheaply recognize a compact, flat ``{"msgtype":"pingk","status":0}`` frame.
+
+    The markers only count when the frame is a single JSON object with no
+    nested objects, so both pairs are necessarily top-level keys (quotes in
+    string values are escaped and cannot fake them). Any other shape returns
+    False and is left to the full JSON parse.
+    """
+    return (
+        raw.startswith("{")
+        and raw.endswith("}")
+        and raw.count("{") == 1
+        and _PINGK_MARKER in raw
+        and any(marker in raw for marker in _STATUS_OK_MARKERS)
+    )
+
 
 class AuxCloudWebSocket:
     """WebSocket client for real-time device updates with automatic reconnection."""
@@ -47,8 +82,11 @@ class AuxCloudWebSocket:
 
         self.session: aiohttp.ClientSession | None = None
         self.websocket: aiohttp.ClientWebSocketResponse | None = None
-        self._listeners: list[Callable[[dict[str, Any]], Awaitable[None]]] = []
+        # Insertion-ordered set of listeners (O(1) add/remove)
+        self._listeners: dict[Callable[[dict[str, Any]], Awaitable[None]], None] = {}
         self._reconnect_task: asyncio.Task[None] | None = None
+        # Strong references to the listen/keep-alive tasks of the connection
+        self._tasks: set[asyncio.Task[None]] = set()
         self._stop_reconnect = asyncio.Event()
         self.api_initialized = False
 
@@ -58,7 +96,11 @@ class AuxCloudWebSocket:
         Returns:
             Self for context manager usage
         """
-        await self.initialize_websocket()
+        try:
+            await self.initialize_websocket()
+        except BaseException:
+            await self.close()
+            raise
         return self
 
     async def __aexit__(
@@ -74,7 +116,7 @@ class AuxCloudWebSocket:
             exc_val: Exception value if raised
             exc_tb: Exception traceback if raised
         """
-        await self.close_websocket()
+        await self.close()
 
     async def initialize_websocket(self) -> None:
         """Initialize WebSocket connection and authenticate.
@@ -83,44 +125,55 @@ class AuxCloudWebSocket:
             Exception: If connection fails
         """
         url = f"{self.websocket_url}/appsync/apprelay/relayconnect"
+        # Connecting (again) re-arms automatic reconnection after close_websocket()
+        self._stop_reconnect.clear()
 
         try:
-            # Create session (will be closed in close_websocket)
-            self.session = aiohttp.ClientSession()
+            # Drop a previous (e.g. broken) socket and its tasks before replacing it
+            if self.websocket is not None:
+                await self._close_socket()
+
+            # Reuse the session across reconnects (closed in close())
+            if self.session is None or self.session.closed:
+                self.session = aiohttp.ClientSession()
 
             # IMPORTANT: AUX Cloud WebSocket server requires ALL HTTP headers
             # (unlike standard WebSocket implementations). The server validates
             # authentication during handshake using loginsession/userid headers.
             # Reference: maeek/ha-aux-cloud uses full headers without filtering.
-            logger.debug(f"Attempting WebSocket connection to: {url}")
-            logger.debug(f"WebSocket headers: {self.headers}")
-            logger.debug(f"Auth: userid={self.userid}, loginsession={self.loginsession[:20]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Attempting WebSocket connection to: %s", url)
+                logger.debug("WebSocket headers: %s", self.headers)
+                logger.debug(
+                    "Auth: userid=%s, loginsession=%s...", self.userid, self.loginsession[:20]
+                )
 
             try:
                 self.websocket = await self.session.ws_connect(url, headers=self.headers, ssl=False)
             except aiohttp.WSServerHandshakeError as handshake_error:
                 # Capture detailed handshake error information
                 logger.error("WebSocket handshake failed!")
-                logger.error(f"  Status: {handshake_error.status}")
-                logger.error(f"  Message: {handshake_error.message}")
-                logger.error(f"  Headers sent: {self.headers}")
+                logger.error("  Status: %s", handshake_error.status)
+                logger.error("  Message: %s", handshake_error.message)
+                logger.error("  Headers sent: %s", self.headers)
                 if handshake_error.headers:
-                    logger.error(f"  Response headers: {dict(handshake_error.headers)}")
+                    logger.error("  Response headers: %s", dict(handshake_error.headers))
                 # Try to read response body if available
                 if hasattr(handshake_error, "history") and handshake_error.history:
-                    logger.error(f"  Response history: {handshake_error.history}")
+                    logger.error("  Response history: %s", handshake_error.history)
                 raise
 
             logger.info("WebSocket connection established")
+            self._configure_socket()
 
             # Start listening for messages
-            asyncio.create_task(self._listen_to_websocket())
+            self._spawn(self._listen_to_websocket())
 
             # Send initialization message
             await self.send_data(
                 {
                     "data": {"relayrule": "share"},
-                    "messageid": str(int(time.time())) + "000",
+                    "messageid": f"{int(time.time())}000",
                     "msgtype": "init",
                     "scope": {
                         "loginsession": self.loginsession,
@@ -130,28 +183,62 @@ class AuxCloudWebSocket:
             )
 
             # Start keep-alive loop
-            asyncio.create_task(self._keepalive_loop())
+            self._spawn(self._keepalive_loop())
 
         except Exception as e:
             logger.error("Failed to establish WebSocket connection: %s", e)
-            await self.close_websocket()
+            # Only drop the socket: a running reconnect loop must keep retrying
+            await self._close_socket()
             raise
 
+    def _configure_socket(self) -> None:
+        """Enable TCP keepalive probes on the connected WebSocket socket."""
+        sock = self.websocket.get_extra_info("socket") if self.websocket else None
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for name, value in _TCP_KEEPALIVE_OPTIONS:
+                # Not every platform exposes all options (e.g. macOS lacks TCP_KEEPIDLE)
+                option = getattr(socket, name, None)
+                if option is not None:
+                    sock.setsockopt(socket.IPPROTO_TCP, option, value)
+        except OSError as e:
+            logger.debug("Could not configure WebSocket socket: %s", e)
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a connection task, keeping a reference until it finishes.
+
+        Args:
+            coro: Coroutine to run as a task
+        """
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
     async def _listen_to_websocket(self) -> None:
         """Listen for incoming WebSocket messages."""
-        if not self.websocket:
+        ws = self.websocket
+        if not ws:
             return
 
+        loads = jsonutil.loads
         try:
-            async for msg in self.websocket:
+            async for msg in ws:
                 if msg.type == aiohttp.WSMsgType.TEXT:
-                    data = json.loads(msg.data)
+                    # Fast path for ping acks; anything else (including a
+                    # differently formatted ack) goes through the full parse
+                    if _is_ping_ack(msg.data):
+                        logger.debug("WebSocket ping acknowledged")
+                        continue
+
+                    data = msg.json(loads=loads)
                     status = data.get("status", -1)
                     msgtype = data.get("msgtype")
 
                     # Handle authentication/ping failures
                     if status != 0 and msgtype in {"initk", "pingk"}:
-                        await self.close_websocket()
+                        await self._close_socket()
                         await self._schedule_reconnect()
                         logger.debug(
                             "Received WebSocket message status %s, reconnecting...",
@@ -172,7 +259,8 @@ class AuxCloudWebSocket:
 
                     # Notify listeners of data messages
                     logger.debug("WebSocket message received: %s", msg.data)
-                    await self._notify_listeners(data)
+                    if self._listeners:
+                        await self._notify_listeners(data)
 
                 elif msg.type == aiohttp.WSMsgType.ERROR:
                     logger.error("WebSocket error: %s", msg.data)
@@ -181,18 +269,16 @@ class AuxCloudWebSocket:
         except Exception as e:
             logger.error("WebSocket connection lost: %s", e)
         finally:
-            await self._schedule_reconnect()
+            # Reconnect only if this is still the active socket; a socket
+            # closed or replaced on purpose is handled by whoever did it
+            if self.websocket is ws:
+                await self._schedule_reconnect()
 
     async def _keepalive_websocket(self) -> None:
         """Send keep-alive ping to server."""
         if self.websocket and not self.websocket.closed:
             try:
-                await self.send_data(
-                    {
-                        "messageid": str(int(time.time())) + "000",
-                        "msgtype": "ping",
-                    }
-                )
+                await self.websocket.send_str(f"{_PING_PREFIX}{int(time.time())}000{_PING_SUFFIX}")
                 logger.debug("WebSocket keep-alive sent")
             except Exception as e:
                 logger.error("Failed to send WebSocket keep-alive: %s", e)
@@ -210,11 +296,24 @@ class AuxCloudWebSocket:
         Args:
             message: Message data to send to listeners
         """
-        for listener in self._listeners:
+        # Snapshot so listeners can (un)register while being notified
+        listeners = tuple(self._listeners)
+        if len(listeners) == 1:
             try:
-                await listener(message)
+                await listeners[0](message)
             except Exception as e:
                 logger.error("Error in WebSocket listener: %s", e)
+            return
+
+        # Run listeners concurrently so a slow one doesn't delay the others
+        results = await asyncio.gather(
+            *(listener(message) for listener in listeners), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error in WebSocket listener: %s", result)
+            elif isinstance(result, BaseException):
+                raise result
 
     def add_websocket_listener(self, listener: Callable[[dict[str, Any]], Awaitable[None]]) -> None:
         """Register a listener for WebSocket messages.
@@ -222,7 +321,7 @@ class AuxCloudWebSocket:
         Args:
             listener: Async callable that receives message dict
         """
-        self._listeners.append(listener)
+        self._listeners[listener] = None
 
     def remove_websocket_listener(
         self, listener: Callable[[dict[str, Any]], Awaitable[None]]
@@ -232,18 +331,16 @@ class AuxCloudWebSocket:
         Args:
             listener: Listener to remove
         """
-        if listener in self._listeners:
-            self._listeners.remove(listener)
+        self._listeners.pop(listener, None)
 
     async def _schedule_reconnect(self) -> None:
-        """Schedule automatic reconnection if not already scheduled."""
-        if self._reconnect_task is None:
-            self._stop_reconnect.clear()
+        """Schedule automatic reconnection unless scheduled or closed on purpose."""
+        if self._reconnect_task is None and not self._stop_reconnect.is_set():
             self._reconnect_task = asyncio.create_task(self._reconnect())
 
     async def _reconnect(self) -> None:
         """Reconnection loop with exponential backoff."""
-        retry_delay = 10  # Start with 10 seconds
+        retry_delay = 10.0  # Start with 10 seconds, doubling up to 5 minutes
 
         while not self._stop_reconnect.is_set():
             logger.debug("Attempting to reconnect WebSocket...")
@@ -254,9 +351,9 @@ class AuxCloudWebSocket:
                 return
             except (ConnectionError, aiohttp.ClientError, asyncio.TimeoutError) as e:
                 logger.error("Reconnect failed: %s", e)
-                await asyncio.sleep(retry_delay)
-                # Could add exponential backoff here if needed
-                # retry_delay = min(retry_delay * 2, 300)  # Max 5 minutes
+                # Up to 10% jitter so many clients don't retry in lockstep
+                await asyncio.sleep(retry_delay + random.uniform(0, retry_delay * 0.1))
+                retry_delay = min(retry_delay * 2, 300.0)
 
     async def send_data(self, data: dict[str, Any]) -> None:
         """Send JSON data to WebSocket server.
@@ -271,7 +368,8 @@ class AuxCloudWebSocket:
             raise ConnectionError("WebSocket is not connected")
 
         try:
-            json_data = json.dumps(data)
+            # The server expects TEXT frames, so send the encoded JSON as str
+            json_data = jsonutil.dumps(data)
             await self.websocket.send_str(json_data)
             logger.debug("Sent JSON data via WebSocket: %s", json_data)
         except Exception as e:
@@ -290,17 +388,29 @@ class AuxCloudWebSocket:
                 await self._reconnect_task
             self._reconnect_task = None
 
+        await self._close_socket()
+        logger.info("WebSocket connection closed")
+
+    async def _close_socket(self) -> None:
+        """Close the current socket and its tasks, leaving reconnection alone."""
+        # Stop listen/keep-alive tasks (except the one closing the connection)
+        current = asyncio.current_task()
+        for task in tuple(self._tasks):
+            if task is not current:
+                task.cancel()
+
         # Close WebSocket
         if self.websocket and not self.websocket.closed:
             await self.websocket.close()
-            self.websocket = None
+        self.websocket = None
+
+        self.api_initialized = False
+
+    async def close(self) -> None:
+        """Close the WebSocket connection and the underlying HTTP session."""
+        await self.close_websocket()
 
         # IMPORTANT: Close the session to prevent resource leak
         if self.session and not self.session.closed:
             await self.session.close()
-            # Give the session time to close gracefully
-            await asyncio.sleep(0.25)
-            self.session = None
-
-        self.api_initialized = False
-        logger.info("WebSocket connection closed")
+        self.session = None
@@ -37,6 +37,10 @@ class CLICommands:
         self.config = config_manager or ConfigManager()
         self.manager = device_manager or DeviceManager(region=self.config.get_region())
 
+    async def close(self) -> None:
+        """Release network resources held by the device manager."""
+        await self.manager.close()
+
     async def login(self, email: str, password: str, region: str = "EU") -> None:
         """Login and save credentials.
 
@@ -47,6 +51,7 @@ class CLICommands:
         """
         try:
             # Create new manager with correct region
+            await self.manager.close()
             self.manager = DeviceManager(region=region.lower())
             await self.manager.login(email, password)
 
@@ -12,7 +12,8 @@ import keyring
 from pydantic import BaseModel, Field, field_validator
 
 from climate_hub.acfreedom.exceptions import ConfigurationError
-from climate_hub.api.models import Device, Region
+from climate_hub.api import jsonutil
+from climate_hub.api.models import DEVICE_LIST_ADAPTER, Device, Region
 
 logger = logging.getLogger(__name__)
 
@@ -75,8 +76,7 @@ class ConfigManager:
             return AppConfig()
 
         try:
-            with open(self.config_path) as f:
-                data = json.load(f)
+            data = jsonutil.loads(self.config_path.read_bytes())
 
             # Check for legacy plaintext password and migrate to keyring
             legacy_password = data.get("password")
@@ -207,7 +207,7 @@ class ConfigManager:
         Returns:
             List of cached devices
         """
-        return [Device(**d) for d in self.config.devices]
+        return DEVICE_LIST_ADAPTER.validate_python(self.config.devices)
 
     def get_region(self) -> str:
         """Get configured region.
@@ -5,10 +5,20 @@ from __future__ import annotations
 import argparse
 import asyncio
 import sys
+from collections.abc import Coroutine
+from typing import Any
 
 from climate_hub.cli.commands import CLICommands
 
 
+async def _run(cli: CLICommands, command: Coroutine[Any, Any, None]) -> None:
+    """Run a CLI command, then release the client's network resources."""
+    try:
+        await command
+    finally:
+        await cli.close()
+
+
 def main() -> None:
     """Main entry point for Climate Hub CLI."""
     parser = argparse.ArgumentParser(
@@ -88,25 +98,25 @@ def main() -> None:
 
     # Execute command
     if args.command == "login":
-        asyncio.run(cli.login(args.email, args.password, args.region))
+        asyncio.run(_run(cli, cli.login(args.email, args.password, args.region)))
     elif args.command == "list":
-        asyncio.run(cli.list_devices(args.shared))
+        asyncio.run(_run(cli, cli.list_devices(args.shared)))
     elif args.command == "status":
-        asyncio.run(cli.device_status(args.device))
+        asyncio.run(_run(cli, cli.device_status(args.device)))
     elif args.command == "on":
-        asyncio.run(cli.set_power(args.device, True))
+        asyncio.run(_run(cli, cli.set_power(args.device, True)))
     elif args.command == "off":
-        asyncio.run(cli.set_power(args.device, False))
+        asyncio.run(_run(cli, cli.set_power(args.device, False)))
     elif args.command == "temp":
-        asyncio.run(cli.set_temperature(args.device, args.temperature))
+        asyncio.run(_run(cli, cli.set_temperature(args.device, args.temperature)))
     elif args.command == "mode":
-        asyncio.run(cli.set_mode(args.device, args.mode))
+        asyncio.run(_run(cli, cli.set_mode(args.device, args.mode)))
     elif args.command == "fan":
-        asyncio.run(cli.set_fan_speed(args.device, args.speed))
+        asyncio.run(_run(cli, cli.set_fan_speed(args.device, args.speed)))
     elif args.command == "swing":
-        asyncio.run(cli.set_swing(args.device, args.direction, args.state))
+        asyncio.run(_run(cli, cli.set_swing(args.device, args.direction, args.state)))
     elif args.command == "watch":
-        asyncio.run(cli.watch())
+        asyncio.run(_run(cli, cli.watch()))
 
 
 if __name__ == "__main__":
@@ -127,6 +127,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     except asyncio.CancelledError:
         logger.info("Cloud listener task stopped")
 
+    await api_client.close()
+
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application.
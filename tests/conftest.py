@@ -0,0 +1,46 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from climate_hub.api.models import Device
+
+
+@pytest.fixture
+def device_payload():
+    """Fixture for building raw device-list entries as returned by the API."""
+
+    def build(endpoint_id="d1", **overrides):
+        payload = {
+            "endpointId": endpoint_id,
+            "productId": "p1",
+            "friendlyName": "Living Room",
+            "mac": "mac1",
+            "devSession": "s1",
+            "devicetypeFlag": 1,
+            "cookie": "Y29va2ll",  # "cookie" in base64
+        }
+        payload.update(overrides)
+        return payload
+
+    return build
+
+
+@pytest.fixture
+def make_device():
+    """Fixture for building Device objects (online unless state is given)."""
+
+    def build(endpoint_id="d1", **overrides):
+        fields = {
+            "endpointId": endpoint_id,
+            "productId": "p1",
+            "friendlyName": "Kitchen AC",
+            "mac": "mac",
+            "devSession": "sess",
+            "devicetypeFlag": 1,
+            "cookie": "c",
+            "state": 1,
+        }
+        fields.update(overrides)
+        return Device(**fields)
+
+    return build
@@ -0,0 +1,93 @@
+"""Unit tests for AuxCloudAPI."""
+
+import asyncio
+
+import pytest
+
+from climate_hub.api.client import AuxCloudAPI
+from climate_hub.api.exceptions import AuxAPIError
+
+
+@pytest.fixture
+async def api():
+    """Fixture for an API client that is closed after the test."""
+    client = AuxCloudAPI(region="eu", max_concurrency=4)
+    yield client
+    await client.close()
+
+
+async def test_session_is_shared_between_requests(api):
+    """Test one session and request limiter are reused until close()."""
+    session, limit = api._get_session()
+
+    assert api._get_session() == (session, limit)
+    assert limit._value == 4
+
+    await api.close()
+    new_session, new_limit = api._get_session()
+
+    assert session.closed
+    assert new_session is not session
+    assert new_limit is not limit
+
+
+async def test_closed_session_is_recreated(api):
+    """Test a session closed elsewhere is replaced on the next request."""
+    session, _ = api._get_session()
+    await session.close()
+
+    new_session, _ = api._get_session()
+
+    assert new_session is not session
+    assert not new_session.closed
+
+
+async def test_get_families_is_cached(api, mocker):
+    """Test get_families() reuses its result until invalidated or expired."""
+    families = [{"familyid": "f1", "name": "Home"}]
+    request = mocker.patch.object(
+        api, "_make_request", return_value={"status": 0, "data": {"familyList": families}}
+    )
+    mocker.patch.object(api, "_get_headers", return_value={})
+
+    assert await api.get_families() == families
+    assert await api.get_families() == families
+    assert request.call_count == 1
+
+    api.invalidate_families()
+    await api.get_families()
+    assert request.call_count == 2
+
+    api.families_ttl = 0
+    await api.get_families()
+    assert request.call_count == 3
+
+
+async def test_get_families_failure_is_not_cached(api, mocker):
+    """Test a failed family lookup is retried on the next call."""
+    request = mocker.patch.object(api, "_make_request", return_value={"status": -1})
+    mocker.patch.object(api, "_get_headers", return_value={})
+
+    with pytest.raises(AuxAPIError):
+        await api.get_families()
+    with pytest.raises(AuxAPIError):
+        await api.get_families()
+
+    assert request.call_count == 2
+
+
+def test_session_from_previous_loop_is_closed():
+    """Test a session left by a finished event loop is closed when replaced."""
+    api = AuxCloudAPI(region="eu")
+
+    async def get_session():
+        return api._get_session()[0]
+
+    old_session = asyncio.run(get_session())
+    old_connector = old_session.connector
+    new_session = asyncio.run(get_session())
+
+    assert new_session is not old_session
+    assert old_session.closed
+    assert old_connector.closed
+    asyncio.run(api.close())
@@ -43,8 +43,10 @@ def test_validate_mode_valid():
 
 def test_validate_mode_invalid():
     """Test invalid mode validation."""
-    with pytest.raises(InvalidParameterError):
+    with pytest.raises(InvalidParameterError) as exc:
         DeviceControl.validate_mode("invalid")
+    assert "cool, heat, dry, fan, auto" in str(exc.value)
+    assert exc.value.details == {"param_name": "mode", "value": "invalid"}
 
 
 def test_get_mode_name():
@@ -0,0 +1,203 @@
+"""Unit tests for DeviceCoordinator."""
+
+import asyncio
+
+import pytest
+
+from climate_hub.acfreedom.coordinator import DeviceCoordinator, _MonitorState
+from climate_hub.acfreedom.exceptions import DeviceOfflineError, ServerBusyError
+from climate_hub.api.client import AuxCloudAPI
+from climate_hub.api.exceptions import DeviceOfflineError as APIDeviceOfflineError
+from climate_hub.api.exceptions import NetworkError
+from climate_hub.api.exceptions import ServerBusyError as APIServerBusyError
+from climate_hub.api.models import AuxProducts
+
+
+async def _hang(*_args, **_kwargs):
+    """Side effect for a request that never completes."""
+    await asyncio.Event().wait()
+
+
+@pytest.fixture
+def mock_api(mocker):
+    """Fixture for a mocked AuxCloudAPI."""
+    return mocker.create_autospec(AuxCloudAPI, instance=True)
+
+
+@pytest.fixture
+def coordinator(mock_api):
+    """Fixture for DeviceCoordinator with mocked API."""
+    return DeviceCoordinator(api_client=mock_api)
+
+
+async def test_fetch_params_keeps_standard_when_special_fails(coordinator, mock_api, make_device):
+    """Test a failed special-params request keeps the standard params."""
+    device = make_device(productId=next(iter(AuxProducts.HEAT_PUMP_IDS)))
+
+    async def get_device_params(device, params):
+        if params:
+            raise NetworkError("boom")
+        return {"ac_pwr": 1}
+
+    mock_api.get_device_params.side_effect = get_device_params
+
+    await coordinator._fetch_params(device)
+
+    assert device.params == {"ac_pwr": 1}
+
+
+async def test_fetch_params_raises_when_standard_fails(coordinator, mock_api, make_device):
+    """Test a failed standard-params request still fails the fetch."""
+    device = make_device(productId=next(iter(AuxProducts.HEAT_PUMP_IDS)))
+
+    async def get_device_params(device, params):
+        if not params:
+            raise NetworkError("boom")
+        return {"hp_water_tank_temp": 45}
+
+    mock_api.get_device_params.side_effect = get_device_params
+
+    with pytest.raises(NetworkError):
+        await coordinator._fetch_params(device)
+
+
+async def test_control_error_subclass_is_mapped(coordinator, mock_api, make_device):
+    """Test subclasses of mapped API errors get the mapped business exception."""
+
+    class UnreachableError(APIDeviceOfflineError):
+        pass
+
+    coordinator._devices = {"d1": make_device()}
+    mock_api.set_device_params.side_effect = UnreachableError("offline")
+
+    with pytest.raises(DeviceOfflineError) as exc:
+        await coordinator.set_power("d1", True)
+
+    assert isinstance(exc.value.__cause__, UnreachableError)
+
+
+async def test_server_busy_hides_api_cause(coordinator, mock_api, make_device):
+    """Test a busy server raises ServerBusyError without chaining the API error."""
+    coordinator._devices = {"d1": make_device()}
+    mock_api.set_device_params.side_effect = APIServerBusyError("busy")
+
+    with pytest.raises(ServerBusyError) as exc:
+        await coordinator.set_power("d1", True)
+
+    assert exc.value.__cause__ is None
+    assert exc.value.__suppress_context__
+
+
+async def test_device_removed_before_first_poll_releases_latch(coordinator, mock_api, make_device):
+    """Test removing a device whose first poll never finished releases startup."""
+    coordinator._devices = {"d1": make_device()}
+    mock_api.get_device_params.side_effect = _hang
+    mock_api.get_families.return_value = []
+
+    coordinator._start_monitor("d1")
+    await asyncio.sleep(0)
+    assert not coordinator._all_ready.is_set()
+
+    await coordinator._discovery_step()
+
+    assert "d1" not in coordinator._monitors
+    assert coordinator._all_ready.is_set()
+    assert not coordinator._pending_ready
+
+
+async def test_monitor_failing_before_ready_releases_latch(coordinator, mock_api, make_device):
+    """Test a monitor whose first poll fails still releases startup."""
+    coordinator._devices = {"d1": make_device()}
+    mock_api.get_device_params.side_effect = NetworkError("boom")
+
+    coordinator._start_monitor("d1")
+    await asyncio.wait_for(coordinator._all_ready.wait(), timeout=1)
+
+    assert coordinator._monitors["d1"].error_count == 1
+    await coordinator.stop()
+
+
+async def test_mark_ready_counts_each_monitor_once(coordinator, mock_api, make_device):
+    """Test repeated or stale _mark_ready calls do not release other monitors."""
+    coordinator._devices = {"d1": make_device("d1"), "d2": make_device("d2")}
+    mock_api.get_device_params.side_effect = _hang
+
+    coordinator._start_monitor("d1")
+    coordinator._start_monitor("d2")
+    state = coordinator._monitors["d1"]
+
+    coordinator._mark_ready("d1", state)
+    coordinator._mark_ready("d1", state)
+    coordinator._mark_ready("d1", _MonitorState())
+
+    assert list(coordinator._pending_ready) == ["d2"]
+    assert not coordinator._all_ready.is_set()
+    await coordinator.stop()
+
+
+async def test_triggers_during_debounce_are_coalesced(coordinator, mock_api, make_device):
+    """Test rapid triggers cause one refresh and leave the trigger cleared."""
+    coordinator._devices = {"d1": make_device()}
+    coordinator.debounce_delay = 0.1
+    mock_api.get_device_params.return_value = {"ac_pwr": 1}
+
+    coordinator._start_monitor("d1")
+    await asyncio.wait_for(coordinator._all_ready.wait(), timeout=1)
+    state = coordinator._monitors["d1"]
+
+    for _ in range(5):
+        coordinator.trigger_update("d1")
+        await asyncio.sleep(0.005)
+    assert state.trigger.is_set()
+
+    await asyncio.sleep(0.2)
+
+    assert mock_api.get_device_params.await_count == 2
+    assert not state.trigger.is_set()
+    await coordinator.stop()
+
+
+async def test_error_backoff_grows_and_resets(coordinator, mock_api, make_device, mocker):
+    """Test consecutive failures back off exponentially and a success resets them."""
+    coordinator._devices = {"d1": make_device()}
+    mock_api.get_device_params.side_effect = [NetworkError("boom")] * 3 + [{"ac_pwr": 1}]
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+        await real_sleep(0)
+
+    mocker.patch("climate_hub.acfreedom.coordinator.asyncio.sleep", side_effect=fake_sleep)
+
+    coordinator._start_monitor("d1")
+    state = coordinator._monitors["d1"]
+    while mock_api.get_device_params.await_count < 4:
+        await real_sleep(0)
+
+    assert delays == [5, 10, 20]
+    assert state.error_count == 0
+    await coordinator.stop()
+
+
+async def test_removed_device_drops_monitor_state(
+    coordinator, mock_api, make_device, device_payload
+):
+    """Test a device missing from discovery loses its monitor; others keep theirs."""
+    coordinator._devices = {"d1": make_device("d1"), "d2": make_device("d2")}
+    mock_api.get_device_params.return_value = {}
+    mock_api.get_families.return_value = [{"familyid": "f1"}]
+    mock_api.get_devices.side_effect = [[device_payload("d2")], []]
+    mock_api.bulk_query_device_state.return_value = {"data": [{"did": "d2", "state": 1}]}
+
+    coordinator._start_monitor("d1")
+    coordinator._start_monitor("d2")
+    removed = coordinator._monitors["d1"]
+
+    await coordinator._discovery_step()
+    await asyncio.gather(removed.task, return_exceptions=True)
+
+    assert removed.task.done()
+    assert list(coordinator._monitors) == ["d2"]
+    assert list(coordinator._devices) == ["d2"]
+    await coordinator.stop()
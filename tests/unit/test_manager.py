@@ -1,10 +1,20 @@
 """Unit tests for DeviceManager."""
 
+import asyncio
+import gc
+import logging
+import time
+
 import pytest
 
-from climate_hub.acfreedom.exceptions import AuthenticationError
+from climate_hub.acfreedom.exceptions import (
+    AuthenticationError,
+    ClimateHubError,
+    DeviceNotFoundError,
+)
 from climate_hub.acfreedom.manager import DeviceManager
-from climate_hub.api.models import Device
+from climate_hub.api.exceptions import NetworkError
+from climate_hub.api.models import AuxProducts, Device
 
 
 @pytest.fixture
@@ -86,3 +96,213 @@ async def test_find_device_by_name(manager):
 
     found = manager.find_device("kitchen")
     assert found == device
+
+
+async def test_find_device_prefers_exact_name(manager, make_device):
+    """Test exact name match wins over an earlier partial match."""
+    partial = make_device("id-1", friendlyName="Kitchen AC Upstairs")
+    exact = make_device("id-2", friendlyName="Kitchen AC")
+    manager.devices = [partial, exact]
+
+    assert manager.find_device("kitchen ac") is exact
+    assert manager.find_device("upstairs") is partial
+    assert manager.find_device("id-2") is exact
+
+
+async def test_refresh_devices_partial_family_failure(manager, mock_api, device_payload):
+    """Test a failing family does not discard devices from the others."""
+    mock_api.get_families.return_value = [{"familyid": "f1"}, {"familyid": "f2"}]
+
+    async def get_devices(family_id, shared=False):
+        if family_id == "f2":
+            raise NetworkError("boom")
+        return [device_payload("d1")]
+
+    mock_api.get_devices.side_effect = get_devices
+    mock_api.bulk_query_device_state.return_value = {
+        "data": [{"did": "d1", "state": 0, "status": 0}]
+    }
+
+    devices = await manager.refresh_devices()
+
+    assert [d.endpoint_id for d in devices] == ["d1"]
+
+
+async def test_partial_failure_keeps_previous_family_devices(manager, mock_api, device_payload):
+    """Test devices of a family that fails to list survive the refresh."""
+    mock_api.get_families.return_value = [{"familyid": "f1"}, {"familyid": "f2"}]
+    failing = set()
+
+    async def get_devices(family_id, shared=False):
+        if family_id in failing:
+            raise NetworkError("boom")
+        return [device_payload("d1" if family_id == "f1" else "d2")]
+
+    mock_api.get_devices.side_effect = get_devices
+    mock_api.bulk_query_device_state.return_value = {
+        "data": [{"did": "d1", "state": 0, "status": 0}, {"did": "d2", "state": 0, "status": 0}]
+    }
+    first = await manager.refresh_devices()
+    previous_d2 = next(d for d in first if d.endpoint_id == "d2")
+
+    failing.add("f2")
+    devices = await manager.refresh_devices()
+
+    assert sorted(d.endpoint_id for d in devices) == ["d1", "d2"]
+    assert manager.find_device("d2") is previous_d2
+
+
+async def test_concurrent_refreshes_are_shared(manager, mock_api):
+    """Test concurrent refresh_devices calls share one in-flight refresh."""
+    mock_api.get_families.return_value = []
+
+    first, second = await asyncio.gather(manager.refresh_devices(), manager.refresh_devices())
+
+    assert first is second
+    mock_api.get_families.assert_called_once()
+
+
+async def test_get_devices_cached_hit(manager, mock_api, make_device):
+    """Test a fresh cache is served without calling the API."""
+    mock_api.get_families.return_value = []
+    await manager.refresh_devices()
+    manager.devices = [make_device()]
+
+    devices = await manager.get_devices_cached()
+
+    assert devices == manager.devices
+    mock_api.get_families.assert_called_once()
+
+
+async def test_set_power_skips_noop(manager, mock_api, make_device):
+    """Test set_* does not call the API when the value is already applied."""
+    device = make_device(params={"pwr": 1, "temp": 220})
+    manager.devices = [device]
+
+    await manager.set_power("d1", True)
+    await manager.set_temperature("d1", 22)
+    mock_api.set_device_params.assert_not_called()
+
+    await manager.set_power("d1", False)
+    mock_api.set_device_params.assert_called_once_with(device, {"pwr": 0})
+
+
+async def test_rapid_writes_are_coalesced(manager, mock_api, make_device):
+    """Test concurrent set_* calls on one device are merged into one request."""
+    device = make_device()
+    manager.devices = [device]
+
+    await asyncio.gather(
+        manager.set_temperature("d1", 23),
+        manager.set_mode("d1", "heat"),
+        manager.set_power("d1", True),
+    )
+
+    mock_api.set_device_params.assert_called_once_with(
+        device, {"temp": 230, "ac_mode": 1, "pwr": 1}
+    )
+
+
+async def test_set_patches_cached_device(manager, mock_api, make_device):
+    """Test a successful write updates the cached device and marks the cache stale."""
+    device = make_device(params={"pwr": 0, "temp": 220})
+    manager.devices = [device]
+    manager._cache_timestamp = time.time()
+    manager.write_coalesce_delay = 0
+
+    await manager.set_temperature("d1", 24)
+
+    assert device.params == {"pwr": 0, "temp": 240}
+    assert time.time() - manager._cache_timestamp >= manager._cache_ttl
+
+
+async def test_failed_background_refresh_logs_warning(manager, mock_api, make_device, caplog):
+    """Test a failed stale-while-revalidate refresh is reported at warning level."""
+    manager.devices = [make_device()]
+    manager._cache_timestamp = time.time() - manager._cache_ttl - 1
+    mock_api.get_families.side_effect = NetworkError("boom")
+
+    with caplog.at_level(logging.WARNING):
+        assert await manager.get_devices_cached() == manager.devices
+        await asyncio.gather(*manager._refresh_tasks.values(), return_exceptions=True)
+
+    record = next(r for r in caplog.records if "refresh failed" in r.message)
+    assert record.levelno == logging.WARNING
+    assert record.exc_info is not None
+
+
+async def test_failed_awaited_refresh_is_not_logged(manager, mock_api, caplog):
+    """Test a refresh error that reaches its caller is not logged a second time."""
+    mock_api.get_families.side_effect = NetworkError("boom")
+
+    with caplog.at_level(logging.WARNING), pytest.raises(ClimateHubError):
+        await manager.refresh_devices()
+    await asyncio.sleep(0)
+
+    assert not [r for r in caplog.records if "refresh failed" in r.message]
+
+
+async def test_coalesced_write_uses_refreshed_device(manager, mock_api, make_device):
+    """Test a refresh between queueing and flushing patches the current device."""
+    stale = make_device(params={"pwr": 0})
+    manager.devices = [stale]
+    write = asyncio.ensure_future(manager.set_power("d1", True))
+    await asyncio.sleep(0)
+
+    fresh = make_device(params={"pwr": 0})
+    manager.devices = [fresh]
+    await manager.flush_now()
+    await write
+
+    mock_api.set_device_params.assert_called_once()
+    assert mock_api.set_device_params.call_args.args[0] is fresh
+    assert fresh.params == {"pwr": 1}
+
+
+async def test_cancelled_write_error_is_retrieved(manager, mock_api, make_device):
+    """Test a failed write with no remaining waiters does not leak an unretrieved error."""
+    errors = []
+    asyncio.get_running_loop().set_exception_handler(lambda loop, ctx: errors.append(ctx))
+    mock_api.set_device_params.side_effect = NetworkError("boom")
+    manager.devices = [make_device()]
+
+    write = asyncio.ensure_future(manager.set_power("d1", True))
+    await asyncio.sleep(0)
+    write.cancel()
+    await manager.flush_now()
+    del write
+    gc.collect()
+
+    assert not [e for e in errors if "never retrieved" in e["message"]]
+
+
+async def test_refresh_devices_null_friendly_name(manager, mock_api, device_payload):
+    """Test a device listed with a null name can still be found."""
+    mock_api.get_families.return_value = [{"familyid": "f1"}]
+    mock_api.get_devices.return_value = [device_payload("d1", friendlyName=None)]
+    mock_api.bulk_query_device_state.return_value = {
+        "data": [{"did": "d1", "state": 0, "status": 0}]
+    }
+
+    devices = await manager.refresh_devices()
+
+    assert devices[0].friendly_name == "Unnamed"
+    assert manager.find_device("d1") is devices[0]
+    with pytest.raises(DeviceNotFoundError):
+        manager.find_device("kitchen")
+
+
+async def test_fetch_params_keeps_standard_when_special_fails(manager, mock_api, make_device):
+    """Test a failed special-params request keeps the standard params."""
+    device = make_device(productId=next(iter(AuxProducts.HEAT_PUMP_IDS)))
+
+    async def get_device_params(device, params):
+        if params:
+            raise NetworkError("boom")
+        return {"ac_pwr": 1}
+
+    mock_api.get_device_params.side_effect = get_device_params
+
+    await manager.fetch_device_params(device)
+
+    assert device.params == {"ac_pwr": 1}
@@ -0,0 +1,23 @@
+"""Unit tests for API models."""
+
+import pytest
+from pydantic import ValidationError
+
+from climate_hub.api.models import Device
+
+
+def test_from_trusted_skips_validation(device_payload):
+    """Test a complete device-list entry builds a Device."""
+    device = Device.from_trusted(device_payload(friendlyName=None))
+
+    assert device.endpoint_id == "d1"
+    assert device.friendly_name == "Unnamed"
+
+
+def test_from_trusted_validates_partial_payload(device_payload):
+    """Test an entry missing required keys is rejected instead of half-built."""
+    payload = device_payload()
+    del payload["devSession"]
+
+    with pytest.raises(ValidationError, match="devSession"):
+        Device.from_trusted(payload)
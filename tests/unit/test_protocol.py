@@ -0,0 +1,73 @@
+"""Unit tests for the AUX Cloud protocol builders and parsers."""
+
+import base64
+import json
+
+import pytest
+
+from climate_hub.api.models import Device
+from climate_hub.api.protocol import (
+    build_control_request,
+    build_query_state_request,
+    parse_control_response,
+)
+
+
+def _message_id_suffix(request):
+    """Return the numeric messageId suffix of a built request."""
+    return int(request["directive"]["header"]["messageId"].rsplit("-", 1)[1])
+
+
+def _device():
+    """Build a minimal device with a valid base64 JSON cookie."""
+    cookie = base64.b64encode(json.dumps({"terminalid": "t1", "aeskey": "k1"}).encode()).decode()
+    return Device(
+        endpointId="d1",
+        productId="p1",
+        friendlyName="Living Room",
+        mac="mac1",
+        devSession="s1",
+        devicetypeFlag=1,
+        cookie=cookie,
+    )
+
+
+def test_query_state_message_ids_increase():
+    """Test consecutive query-state requests get distinct, increasing messageIds."""
+    devices = [{"did": "d1", "devSession": "s1"}]
+    first = build_query_state_request(devices, "user1")
+    second = build_query_state_request(devices, "user1")
+
+    assert first["directive"]["header"]["messageId"].startswith("user1-")
+    assert _message_id_suffix(second) > _message_id_suffix(first)
+
+
+def test_control_message_ids_increase():
+    """Test consecutive control requests get distinct, increasing messageIds."""
+    device = _device()
+    first = build_control_request(device, "get", [])
+    second = build_control_request(device, "get", [])
+
+    assert first["directive"]["header"]["messageId"].startswith("d1-")
+    assert _message_id_suffix(second) > _message_id_suffix(first)
+
+
+def _control_response(params, vals):
+    """Build a successful control response carrying params and vals."""
+    data = json.dumps({"params": params, "vals": vals})
+    return {"event": {"header": {"name": "Response"}, "payload": {"data": data}}}
+
+
+def test_parse_control_response_pairs_params_and_vals():
+    """Test each param is mapped to the value at the same position."""
+    response = _control_response(["pwr", "temp"], [[{"val": 1}], [{"val": 240}]])
+
+    assert parse_control_response(response) == {"pwr": 1, "temp": 240}
+
+
+def test_parse_control_response_rejects_length_mismatch():
+    """Test a response with more params than vals is rejected."""
+    response = _control_response(["pwr", "temp"], [[{"val": 1}]])
+
+    with pytest.raises(ValueError, match="Invalid control response"):
+        parse_control_response(response)
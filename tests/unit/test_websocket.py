@@ -0,0 +1,186 @@
+"""Unit tests for AuxCloudWebSocket."""
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from climate_hub.api.websocket import AuxCloudWebSocket, _is_ping_ack
+
+
+class FakeWebSocket:
+    """Minimal stand-in for aiohttp.ClientWebSocketResponse."""
+
+    def __init__(self):
+        self.closed = False
+        self.sent = []
+        self._close_event = asyncio.Event()
+
+    def get_extra_info(self, name, default=None):
+        return default
+
+    async def send_str(self, data):
+        self.sent.append(data)
+
+    async def close(self):
+        self.closed = True
+        self._close_event.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await self._close_event.wait()
+        raise StopAsyncIteration
+
+
+@pytest.fixture
+async def ws():
+    """Fixture for a WebSocket client that is closed after the test."""
+    client = AuxCloudWebSocket(
+        region="eu", headers={}, loginsession="session-token", userid="user1"
+    )
+    yield client
+    await client.close()
+
+
+async def test_reconnect_backoff_grows_to_cap(ws, mocker):
+    """Test reconnect delays double from 10s up to 300s with at most 10% jitter."""
+    mocker.patch.object(
+        aiohttp.ClientSession,
+        "ws_connect",
+        side_effect=aiohttp.ClientConnectionError("down"),
+    )
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+        if len(delays) == 8:
+            ws._stop_reconnect.set()
+
+    mocker.patch("climate_hub.api.websocket.asyncio.sleep", side_effect=fake_sleep)
+
+    await ws._reconnect()
+
+    expected = [10, 20, 40, 80, 160, 300, 300, 300]
+    assert len(delays) == len(expected)
+    for delay, base in zip(delays, expected, strict=True):
+        assert base <= delay <= base * 1.1
+
+
+async def test_failing_listener_does_not_block_others(ws):
+    """Test a listener that raises does not stop the other listeners."""
+    received = []
+
+    async def slow(message):
+        await asyncio.sleep(0.01)
+        received.append(("slow", message))
+
+    async def failing(message):
+        raise RuntimeError("boom")
+
+    async def fast(message):
+        received.append(("fast", message))
+
+    for listener in (slow, failing, fast):
+        ws.add_websocket_listener(listener)
+
+    await ws._notify_listeners({"msgtype": "push"})
+
+    # Listeners run concurrently, so the fast one finishes first
+    assert received == [("fast", {"msgtype": "push"}), ("slow", {"msgtype": "push"})]
+
+
+async def test_remove_listener(ws):
+    """Test removed listeners (including bound methods) are no longer notified."""
+    received = []
+
+    class Handler:
+        async def on_message(self, message):
+            received.append(message)
+
+    handler = Handler()
+    ws.add_websocket_listener(handler.on_message)
+    ws.remove_websocket_listener(handler.on_message)
+    ws.remove_websocket_listener(handler.on_message)  # unknown listener is ignored
+
+    await ws._notify_listeners({"msgtype": "push"})
+
+    assert received == []
+
+
+async def test_close_websocket_cancels_tracked_tasks(ws):
+    """Test close_websocket() cancels the listen/keep-alive tasks it tracks."""
+
+    async def forever():
+        await asyncio.sleep(3600)
+
+    ws._spawn(forever())
+    ws._spawn(forever())
+    tasks = set(ws._tasks)
+    await asyncio.sleep(0)
+
+    await ws.close_websocket()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(task.cancelled() for task in tasks)
+    assert not ws._tasks
+
+
+async def test_session_reused_across_reconnects(mocker):
+    """Test reconnecting keeps the HTTP session and close() releases it."""
+
+    async def ws_connect(*args, **kwargs):
+        return FakeWebSocket()
+
+    mocker.patch.object(aiohttp.ClientSession, "ws_connect", side_effect=ws_connect)
+    client = AuxCloudWebSocket(region="eu", headers={}, loginsession="token", userid="user1")
+
+    async with client:
+        session = client.session
+        first = client.websocket
+        assert '"msgtype":"init"' in first.sent[0]
+
+        await client.close_websocket()
+        await client.initialize_websocket()
+
+        assert client.session is session
+        assert client.websocket is not first
+        assert first.closed
+
+    assert client.session is None
+    assert session.closed
+
+
+async def test_failed_connect_closes_session(mocker):
+    """Test a failing initial connect in ``async with`` does not leak the session."""
+    mocker.patch.object(
+        aiohttp.ClientSession,
+        "ws_connect",
+        side_effect=aiohttp.ClientConnectionError("down"),
+    )
+    client = AuxCloudWebSocket(region="eu", headers={}, loginsession="token", userid="user1")
+
+    with pytest.raises(aiohttp.ClientConnectionError):
+        async with client:
+            pass
+
+    assert client.session is None
+    assert client._reconnect_task is None
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ('{"msgtype":"pingk","status":0}', True),
+        ('{"status":0,"msgtype":"pingk"}', True),
+        ('{"msgtype":"pingk","status":-1}', False),
+        ('{"msgtype":"pingk","status":0.5}', False),
+        ('{"msgtype":"pingk","status":-1,"data":{"status":0}}', False),
+        ('{"msgtype":"push","data":{"msgtype":"pingk","status":0}}', False),
+        ('{"msgtype": "pingk", "status": 0}', False),
+    ],
+)
+def test_is_ping_ack_only_matches_flat_successful_acks(raw, expected):
+    """Test the ping-ack fast path ignores failures and nested markers."""
+    assert _is_ping_ack(raw) is expected